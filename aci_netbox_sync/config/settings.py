@@ -52,6 +52,14 @@ class SyncSettings:
     dry_run: bool = field(default_factory=lambda: os.getenv("SYNC_DRY_RUN", "false").lower() == "true")
     verify_updates: bool = field(default_factory=lambda: os.getenv("SYNC_VERIFY_UPDATES", "true").lower() == "true")
     continue_on_error: bool = field(default_factory=lambda: os.getenv("SYNC_CONTINUE_ON_ERROR", "true").lower() == "true")
+    # Opt-in: seconds before pre-fetched NetBox caches are re-fetched mid-sync (0 disables)
+    cache_ttl: int = field(default_factory=lambda: int(os.getenv("SYNC_CACHE_TTL", "0")))
+    # Opt-in file recording golden image assignments already made, so re-runs
+    # skip them ("" disables). Assignments deleted in NetBox are not recreated
+    # while they are listed in the file.
+    golden_image_cache: str = field(
+        default_factory=lambda: os.getenv("SYNC_GOLDEN_IMAGE_CACHE", "")
+    )
     
     # Object types to sync
     sync_fabrics: bool = True
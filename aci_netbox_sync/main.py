@@ -194,7 +194,9 @@ def main() -> int:
         url=config.netbox.url,
         token=config.netbox.token,
         verify_ssl=config.netbox.verify_ssl,
-        timeout=config.netbox.timeout
+        timeout=config.netbox.timeout,
+        # One pooled connection per sync worker avoids "connection pool is full"
+        pool_size=max(config.sync.max_workers, 16),
     )
     
     # Connect to both systems
@@ -210,7 +212,7 @@ def main() -> int:
     try:
         # Determine modules to run
         modules = get_modules_to_sync(args)
-        logger.info(f"Will sync {len(modules)} object types")
+        logger.info("Will sync %d object types", len(modules))
         
         # Create orchestrator and run sync
         orchestrator = SyncOrchestrator(aci_client, netbox_client, config.sync)
@@ -226,7 +228,7 @@ def main() -> int:
         logger.info("Sync interrupted by user")
         return 130
     except Exception as e:
-        logger.exception(f"Sync failed with error: {e}")
+        logger.exception("Sync failed with error: %s", e)
         return 1
     finally:
         aci_client.disconnect()
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class AppProfileSyncModule(BaseSyncModule):
     """Sync ACI Application Profiles to NetBox."""
 
+    ACI_GETTERS = ('get_app_profiles',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -28,12 +30,13 @@ class AppProfileSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Pre-fetch existing APs per tenant."""
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._ap_map = self.context.setdefault('ap_map', {})
         self._tenant_ap_caches: Dict[int, Dict] = {}
-        tenant_map = self.context.get('tenant_map', {})
-        for tenant_name, tenant_id in tenant_map.items():
+        for tenant_name, tenant_id in self._tenant_map.items():
             cache = self.netbox.fetch_all_app_profiles(tenant_id)
             self._tenant_ap_caches[tenant_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} APs for tenant {tenant_name}")
+            logger.debug("Pre-fetched %d APs for tenant %s", len(cache), tenant_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_app_profiles()
@@ -42,18 +45,17 @@ class AppProfileSyncModule(BaseSyncModule):
         try:
             tenant_name = aci_data.get('tenant')
             if not tenant_name:
-                logger.warning(f"Skipping AP without tenant: {aci_data}")
+                logger.warning("Skipping AP without tenant: %s", aci_data)
                 return False
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
+            tenant_id = self._tenant_map.get(tenant_name)
             if not tenant_id:
-                logger.warning(f"Tenant {tenant_name} not found for AP {aci_data.get('name')}")
+                logger.warning("Tenant %s not found for AP %s", tenant_name, aci_data.get('name'))
                 return False
 
             ap_name = aci_data.get('name')
             if not ap_name:
-                logger.warning(f"Skipping AP without name: {aci_data}")
+                logger.warning("Skipping AP without name: %s", aci_data)
                 return False
 
             ap_params = self._build_params(aci_data)
@@ -66,7 +68,7 @@ class AppProfileSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created Application Profile: {tenant_name}/{ap_name}")
+                logger.info("Created Application Profile: %s/%s", tenant_name, ap_name)
             else:
                 updates = self._build_updates(ap, aci_data)
                 self._apply_updates(
@@ -75,12 +77,11 @@ class AppProfileSyncModule(BaseSyncModule):
                     self.netbox.update_app_profile,
                 )
 
-            ap_map = self.context.setdefault('ap_map', {})
-            ap_map[f"{tenant_name}/{ap_name}"] = ap.id
+            self._ap_map[(tenant_name, ap_name)] = ap.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync AP {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync AP %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
\ No newline at end of file
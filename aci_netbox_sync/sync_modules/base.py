@@ -3,14 +3,24 @@ Base Sync Module - Common synchronization logic and patterns.
 
 Optimized with:
 - _build_updates() to eliminate duplicated field-comparison logic
+- FIELD_MAP/CONVERTERS resolved once per class into _FIELD_SPECS
 - Pre-fetch caching to reduce per-object API lookups
-- Bulk create support for new objects
+- Bulk create/update support: writes queued with _queue_create() and
+  _queue_update() are flushed in batches of settings.batch_size
 - Removed fake sync_parallel (was running sequentially)
+- Real thread-pool dispatch of sync_object() for modules that set
+  PARALLEL_SAFE, sized by settings.max_workers
+- _run_concurrently() to overlap independent pre-fetches and bulk batches
+- Duplicate ACI objects dropped before dispatch via _dedupe_key
+- ACI fabric nodes fetched once per run and shared through the context
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import time
 
@@ -29,6 +39,7 @@ def values_equal(current: Any, new: Any) -> bool:
     - None vs empty string
     - Boolean comparisons
     - Nested objects with .id attribute
+    - Choice fields ({value, label}) compared by value
     """
     # Handle None vs empty string
     if current is None and new == '':
@@ -44,6 +55,10 @@ def values_equal(current: Any, new: Any) -> bool:
     if hasattr(new, 'id'):
         new = new.id
 
+    # Handle choice fields
+    if hasattr(current, 'value'):
+        current = current.value
+
     # Handle boolean comparisons
     if isinstance(new, bool):
         current = bool(current) if current is not None else False
@@ -57,6 +72,24 @@ def values_equal(current: Any, new: Any) -> bool:
     return current == new
 
 
+def snapshot(obj: Any, *fields: str) -> Tuple[Any, ...]:
+    """
+    Read several fields of a NetBox object at once, with '' for missing or
+    empty values.
+
+    Reads the instance __dict__ directly, so a field absent from a pynetbox
+    Record does not trigger a lazy full_details() fetch.
+    """
+    attrs = vars(obj)
+    return tuple(attrs.get(f) or '' for f in fields)
+
+
+def related_id(obj: Any, field_name: str) -> Any:
+    """Return the ID of a nested object field, or the raw value if it is not nested."""
+    current = vars(obj).get(field_name)
+    return current.id if hasattr(current, 'id') else current
+
+
 @dataclass
 class SyncResult:
     """Result of a sync operation."""
@@ -127,6 +160,16 @@ class SyncStats:
         return "\n".join(lines)
 
 
+def _field_specs(
+    field_map: Dict[str, str], converters: Dict[str, Callable]
+) -> Tuple[Tuple[str, str, Optional[Callable]], ...]:
+    """Pair each mapped field with its converter so lookups happen once."""
+    return tuple(
+        (aci_field, nb_field, converters.get(aci_field))
+        for aci_field, nb_field in field_map.items()
+    )
+
+
 class BaseSyncModule(ABC):
     """
     Abstract base class for sync modules.
@@ -139,12 +182,37 @@ class BaseSyncModule(ABC):
     - sync_object(): Sync a single object to NetBox
     """
 
+    # Subclasses that declare their own __slots__ carry no per-instance __dict__
+    __slots__ = (
+        'aci', 'netbox', 'settings', 'context', 'result', '_existing_cache',
+        '_pending_creates', '_pending_updates', '_lock', '_cache_loaded_at',
+    )
+
     # Override in subclasses: maps ACI field names -> NetBox field names
     FIELD_MAP: Dict[str, str] = {}
 
     # Override in subclasses: maps ACI field names -> conversion functions
     CONVERTERS: Dict[str, Callable] = {}
 
+    # Set in subclasses whose sync_object() may run concurrently; shared
+    # state they mutate must be guarded by self._lock
+    PARALLEL_SAFE: bool = False
+
+    # ACIClient get_* methods fetch_from_aci() calls; the orchestrator
+    # prefetches their tenant classes for all scheduled modules at once
+    ACI_GETTERS: Tuple[str, ...] = ()
+
+    # Set in subclasses to a staticmethod returning an ACI object's identity;
+    # later duplicates in the fetched list replace earlier ones
+    _dedupe_key: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+    # Built by __init_subclass__: (aci_field, nb_field, converter or None)
+    _FIELD_SPECS: Tuple[Tuple[str, str, Optional[Callable]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SPECS = _field_specs(cls.FIELD_MAP, cls.CONVERTERS)
+
     def __init__(self, aci_client: ACIClient, netbox_client: NetBoxClient,
                  settings: SyncSettings, context: Optional[Dict] = None):
         self.aci = aci_client
@@ -153,6 +221,12 @@ class BaseSyncModule(ABC):
         self.context = context if context is not None else {}
         self.result = SyncResult(object_type=self.object_type)
         self._existing_cache: Dict[str, Any] = {}
+        # endpoint name -> (endpoint, {key: (payload, label, on_created)})
+        self._pending_creates: Dict[str, Tuple[Any, Dict[Any, Tuple]]] = {}
+        # endpoint name -> (endpoint, [(obj, changes, label, update_fn)])
+        self._pending_updates: Dict[str, Tuple[Any, List[Tuple]]] = {}
+        self._lock = threading.RLock()
+        self._cache_loaded_at = 0.0
 
     @property
     @abstractmethod
@@ -181,6 +255,48 @@ class BaseSyncModule(ABC):
         """Hook called after sync completes. Override for cleanup logic."""
         pass
 
+    def refresh_caches(self) -> None:
+        """
+        Hook to re-fetch pre-fetched caches once they are older than
+        settings.cache_ttl. Override in modules whose caches can go stale.
+        """
+        pass
+
+    def _refresh_stale_caches(self) -> None:
+        ttl = self.settings.cache_ttl
+        if ttl <= 0 or time.monotonic() - self._cache_loaded_at < ttl:
+            return
+        with self._lock:
+            # Another worker may have refreshed while we waited for the lock
+            if time.monotonic() - self._cache_loaded_at < ttl:
+                return
+            logger.debug("Refreshing %s caches older than %ss", self.object_type, ttl)
+            try:
+                self.refresh_caches()
+            except Exception as e:
+                # The caches are only replaced once a fetch succeeds, so the
+                # old ones are still intact; retry after another ttl
+                logger.warning("Keeping existing %s caches, refresh failed: %s", self.object_type, e)
+            self._cache_loaded_at = time.monotonic()
+
+    def _specs_for(
+        self,
+        field_map: Optional[Dict[str, str]],
+        converters: Optional[Dict[str, Callable]],
+    ) -> Tuple[Tuple[str, str, Optional[Callable]], ...]:
+        """Return the precomputed field specs, or build them for overrides."""
+        if not field_map and not converters:
+            return self._FIELD_SPECS
+        return _field_specs(field_map or self.FIELD_MAP, converters or self.CONVERTERS)
+
+    def _get_fabric_nodes(self) -> List[Dict[str, Any]]:
+        """Fetch ACI fabric nodes once per sync run and share them via the context."""
+        nodes = self.context.get('fabric_nodes')
+        if nodes is None:
+            nodes = self.aci.get_fabric_nodes()
+            self.context['fabric_nodes'] = nodes
+        return nodes
+
     def _build_updates(
         self,
         existing_obj: Any,
@@ -205,20 +321,18 @@ class BaseSyncModule(ABC):
         Returns:
             Dict of {netbox_field: new_value} for fields that differ.
         """
-        field_map = field_map or self.FIELD_MAP
-        converters = converters or self.CONVERTERS
+        # Read current values straight from the record's instance dict: one
+        # lookup for the object, and no lazy full_details() fetch on a miss
+        current = vars(existing_obj)
         updates = {}
 
-        for aci_field, nb_field in field_map.items():
-            if aci_field not in aci_data:
-                continue
-            value = aci_data[aci_field]
+        for aci_field, nb_field, convert in self._specs_for(field_map, converters):
+            value = aci_data.get(aci_field)
             if value is None:
                 continue
-            if aci_field in converters:
-                value = converters[aci_field](value)
-            current = getattr(existing_obj, nb_field, None)
-            if not values_equal(current, value):
+            if convert is not None:
+                value = convert(value)
+            if not values_equal(current.get(nb_field), value):
                 updates[nb_field] = value
 
         if extra_updates:
@@ -243,18 +357,14 @@ class BaseSyncModule(ABC):
         Returns:
             Dict of {netbox_field: value} for all mapped fields with values.
         """
-        field_map = field_map or self.FIELD_MAP
-        converters = converters or self.CONVERTERS
         params = {}
 
-        for aci_field, nb_field in field_map.items():
-            if aci_field not in aci_data:
-                continue
-            value = aci_data[aci_field]
+        for aci_field, nb_field, convert in self._specs_for(field_map, converters):
+            value = aci_data.get(aci_field)
             if value is None:
                 continue
-            if aci_field in converters:
-                value = converters[aci_field](value)
+            if convert is not None:
+                value = convert(value)
             params[nb_field] = value
 
         return params
@@ -276,54 +386,226 @@ class BaseSyncModule(ABC):
             update_fn: Callable(obj, updates, verify) -> (changed, verified).
         """
         if updates:
-            logger.debug(f"{self.object_type} {obj_label} updates: {updates}")
+            logger.debug("%s %s updates: %s", self.object_type, obj_label, updates)
             changed, verified = update_fn(obj, updates, self.settings.verify_updates)
             if changed:
                 self.result.updated += 1
                 if verified:
                     self.result.verified += 1
-                logger.info(f"Updated {self.object_type}: {obj_label}")
+                logger.info("Updated %s: %s", self.object_type, obj_label)
             else:
                 self.result.unchanged += 1
         else:
             self.result.unchanged += 1
 
+    def _queue_create(
+        self,
+        endpoint: Any,
+        payload: Dict[str, Any],
+        obj_label: str,
+        key: Any = None,
+        on_created: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Queue an object for bulk creation after the sync loop.
+
+        Args:
+            endpoint: pynetbox endpoint to create the object on.
+            payload: Create payload.
+            obj_label: Human-readable label for logging; also the default key.
+            key: Identity of the object; a second create with the same key is
+                treated as unchanged instead of being sent twice.
+            on_created: Called with the created record once it exists.
+        """
+        key = obj_label if key is None else key
+        with self._lock:
+            _, pending = self._pending_creates.setdefault(endpoint.name, (endpoint, {}))
+            if key in pending:
+                logger.debug("%s %s already queued for creation", self.object_type, obj_label)
+                self.result.unchanged += 1
+                return
+            pending[key] = (payload, obj_label, on_created)
+
+    def _queue_update(
+        self,
+        endpoint: Any,
+        obj: Any,
+        updates: Dict[str, Any],
+        obj_label: str,
+        update_fn: Callable,
+    ) -> None:
+        """
+        Queue changed fields of an existing object for a bulk PATCH.
+
+        Args:
+            endpoint: pynetbox endpoint the object belongs to.
+            obj: The NetBox object to update.
+            updates: Dict of field changes.
+            obj_label: Human-readable label for logging.
+            update_fn: Per-object fallback, Callable(obj, updates, verify).
+        """
+        changes = self.netbox.diff_updates(obj, updates) if updates else {}
+        with self._lock:
+            if not changes:
+                self.result.unchanged += 1
+                return
+            logger.debug("%s %s updates: %s", self.object_type, obj_label, changes)
+            _, pending = self._pending_updates.setdefault(endpoint.name, (endpoint, []))
+            pending.append((obj, changes, obj_label, update_fn))
+
+    def _record_failure(self, error: str) -> None:
+        """Count a failed object; safe to call from worker threads."""
+        with self._lock:
+            self.result.failed += 1
+            self.result.errors.append(error)
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        size = max(1, self.settings.batch_size)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _flush_creates(self) -> None:
+        """Send queued creates, one POST per batch, batches in parallel."""
+        for endpoint, pending in self._pending_creates.values():
+            chunks = self._chunks(list(pending.values()))
+            # Batches are independent, so POST them concurrently
+            responses = self._run_concurrently(*(
+                partial(self.netbox.bulk_create, endpoint, [item[0] for item in chunk])
+                for chunk in chunks
+            ))
+            for chunk, records in zip(chunks, responses):
+                if len(records) != len(chunk):
+                    logger.warning(
+                        "Bulk create of %d %s failed, retrying individually",
+                        len(chunk), self.object_type
+                    )
+                    records = []
+                    for payload, label, _ in chunk:
+                        try:
+                            records.append(endpoint.create(payload))
+                        except Exception as e:
+                            logger.error("Failed to create %s %s: %s", self.object_type, label, e)
+                            self.result.failed += 1
+                            self.result.errors.append(f"{label}: {e}")
+                            records.append(None)
+
+                for (payload, label, on_created), record in zip(chunk, records):
+                    if record is None:
+                        continue
+                    self.result.created += 1
+                    logger.info("Created %s: %s", self.object_type, label)
+                    if on_created:
+                        on_created(record)
+        self._pending_creates.clear()
+
+    def _flush_updates(self) -> None:
+        """Send queued updates, one PATCH per batch, batches in parallel."""
+        verify = self.settings.verify_updates
+        for endpoint, pending in self._pending_updates.values():
+            chunks = self._chunks(pending)
+            responses = self._run_concurrently(*(
+                partial(self.netbox.bulk_update, endpoint,
+                        [{'id': obj.id, **changes} for obj, changes, _, _ in chunk])
+                for chunk in chunks
+            ))
+            for chunk, records in zip(chunks, responses):
+                if len(records) != len(chunk):
+                    logger.warning(
+                        "Bulk update of %d %s failed, retrying individually",
+                        len(chunk), self.object_type
+                    )
+                    for obj, changes, label, update_fn in chunk:
+                        self._apply_updates(obj, changes, label, update_fn)
+                    continue
+
+                for (obj, changes, label, _), record in zip(chunk, records):
+                    self.result.updated += 1
+                    if not verify or self.netbox.changes_applied(record, changes):
+                        self.result.verified += 1
+                    logger.info("Updated %s: %s", self.object_type, label)
+        self._pending_updates.clear()
+
+    def flush_pending(self) -> None:
+        """Flush all queued bulk writes. Creates go first so updates can reference them."""
+        self._flush_creates()
+        self._flush_updates()
+
+    def _sync_one(self, obj: Dict[str, Any]) -> bool:
+        try:
+            self._refresh_stale_caches()
+            return self.sync_object(obj)
+        except Exception as e:
+            self._record_failure(f"Error syncing {obj}: {e}")
+            logger.error("Error syncing %s: %s", self.object_type, e)
+            if not self.settings.continue_on_error:
+                raise
+            return False
+
+    def _run_concurrently(self, *tasks: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent I/O-bound callables (pre-fetches, bulk batches) in
+        parallel, bounded by settings.max_workers. Results are returned in
+        task order.
+        """
+        workers = min(len(tasks), self.settings.max_workers)
+        if workers <= 1:
+            return [task() for task in tasks]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda task: task(), tasks))
+
+    def _sync_objects(self, aci_objects: List[Dict[str, Any]]) -> None:
+        """Run sync_object() over all objects, on a thread pool if the module allows it."""
+        workers = self.settings.max_workers if self.PARALLEL_SAFE else 1
+        continue_on_error = self.settings.continue_on_error
+        sync_one = self._sync_one
+        if workers <= 1 or len(aci_objects) <= 1:
+            for obj in aci_objects:
+                if not sync_one(obj) and not continue_on_error:
+                    break
+            return
+
+        logger.debug("Syncing %d %s with %s workers", len(aci_objects), self.object_type, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for success in pool.map(sync_one, aci_objects):
+                if not success and not continue_on_error:
+                    pool.shutdown(cancel_futures=True)
+                    break
+
     def sync(self) -> SyncResult:
         """Execute the sync operation."""
         start_time = time.time()
-        logger.info(f"Starting sync for {self.object_type}")
+        logger.info("Starting sync for %s", self.object_type)
 
         try:
             self.pre_sync()
+            self._cache_loaded_at = time.monotonic()
 
             # Fetch data from ACI
             aci_objects = self.fetch_from_aci()
-            logger.info(f"Fetched {len(aci_objects)} {self.object_type} from ACI")
+            logger.info("Fetched %d %s from ACI", len(aci_objects), self.object_type)
+            if self._dedupe_key is not None:
+                unique = list({self._dedupe_key(d): d for d in aci_objects}.values())
+                if len(unique) < len(aci_objects):
+                    logger.debug(
+                        "Dropped %s duplicate %s",
+                        len(aci_objects) - len(unique), self.object_type
+                    )
+                aci_objects = unique
 
             if self.settings.dry_run:
-                logger.info(f"DRY RUN: Would sync {len(aci_objects)} {self.object_type}")
+                logger.info("DRY RUN: Would sync %d %s", len(aci_objects), self.object_type)
                 self.result.unchanged = len(aci_objects)
             else:
-                for obj in aci_objects:
-                    try:
-                        success = self.sync_object(obj)
-                        if not success and not self.settings.continue_on_error:
-                            break
-                    except Exception as e:
-                        self.result.failed += 1
-                        self.result.errors.append(f"Error syncing {obj}: {e}")
-                        logger.error(f"Error syncing {self.object_type}: {e}")
-                        if not self.settings.continue_on_error:
-                            raise
+                self._sync_objects(aci_objects)
+                self.flush_pending()
 
             self.post_sync()
 
         except Exception as e:
-            logger.error(f"Sync failed for {self.object_type}: {e}")
+            logger.error("Sync failed for %s: %s", self.object_type, e)
             self.result.errors.append(str(e))
 
         self.result.duration_seconds = time.time() - start_time
-        logger.info(f"Completed sync for {self.object_type}: {self.result}")
+        logger.info("Completed sync for %s: %s", self.object_type, self.result)
         return self.result
 
 
@@ -357,13 +639,22 @@ class SyncOrchestrator:
 
     def run_all(self, modules: List[type]) -> SyncStats:
         """Run all sync modules in order."""
-        logger.info(f"Starting sync orchestration with {len(modules)} modules")
+        logger.info("Starting sync orchestration with %d modules", len(modules))
+
+        # Only the classes of scheduled modules are fetched; the getters fall
+        # back to their own queries for anything not prefetched
+        getters = [getter for module_class in modules for getter in module_class.ACI_GETTERS]
+        if getters:
+            try:
+                self.aci.prefetch(*getters)
+            except Exception as e:
+                logger.warning("ACI prefetch failed, querying per module: %s", e)
 
         for module_class in modules:
             try:
                 self.run_module(module_class)
             except Exception as e:
-                logger.error(f"Module {module_class.__name__} failed: {e}")
+                logger.error("Module %s failed: %s", module_class.__name__, e)
                 if not self.settings.continue_on_error:
                     break
 
@@ -31,6 +31,8 @@ def _valid_mac(value: Any) -> Optional[str]:
 class BridgeDomainSyncModule(BaseSyncModule):
     """Sync ACI Bridge Domains to NetBox."""
 
+    ACI_GETTERS = ('get_bridge_domains',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -61,12 +63,14 @@ class BridgeDomainSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Pre-fetch existing BDs per tenant."""
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._vrf_map = self.context.get('vrf_map', {})
+        self._bd_map = self.context.setdefault('bd_map', {})
         self._tenant_bd_caches: Dict[int, Dict] = {}
-        tenant_map = self.context.get('tenant_map', {})
-        for tenant_name, tenant_id in tenant_map.items():
+        for tenant_name, tenant_id in self._tenant_map.items():
             cache = self.netbox.fetch_all_bridge_domains(tenant_id)
             self._tenant_bd_caches[tenant_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} BDs for tenant {tenant_name}")
+            logger.debug("Pre-fetched %d BDs for tenant %s", len(cache), tenant_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_bridge_domains()
@@ -88,32 +92,33 @@ class BridgeDomainSyncModule(BaseSyncModule):
         try:
             tenant_name = aci_data.get('tenant')
             if not tenant_name:
-                logger.warning(f"Skipping BD without tenant: {aci_data}")
+                logger.warning("Skipping BD without tenant: %s", aci_data)
                 return False
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
+            tenant_id = self._tenant_map.get(tenant_name)
             if not tenant_id:
-                logger.warning(f"Tenant {tenant_name} not found for BD {aci_data.get('name')}")
+                logger.warning("Tenant %s not found for BD %s", tenant_name, aci_data.get('name'))
                 return False
 
             # Resolve VRF (may be in different tenant, e.g. common)
             vrf_name = aci_data.get('vrf')
             vrf_tenant = aci_data.get('vrf_tenant', tenant_name)
-            vrf_map = self.context.get('vrf_map', {})
-            vrf_id = vrf_map.get(f"{vrf_tenant}/{vrf_name}") if vrf_name else None
+            vrf_id = self._vrf_map.get((vrf_tenant, vrf_name)) if vrf_name else None
 
             if not vrf_id:
                 bd_name = aci_data.get('name')
                 if vrf_name:
-                    logger.warning(f"VRF {vrf_tenant}/{vrf_name} not found for BD {tenant_name}/{bd_name} - skipping")
+                    logger.warning(
+                        "VRF %s/%s not found for BD %s/%s - skipping",
+                        vrf_tenant, vrf_name, tenant_name, bd_name
+                    )
                 else:
-                    logger.warning(f"BD {tenant_name}/{bd_name} has no VRF assigned - skipping")
+                    logger.warning("BD %s/%s has no VRF assigned - skipping", tenant_name, bd_name)
                 return False
 
             bd_name = aci_data.get('name')
             if not bd_name:
-                logger.warning(f"Skipping BD without name: {aci_data}")
+                logger.warning("Skipping BD without name: %s", aci_data)
                 return False
 
             bd_params = self._build_params(aci_data)
@@ -127,7 +132,7 @@ class BridgeDomainSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created Bridge Domain: {tenant_name}/{bd_name}")
+                logger.info("Created Bridge Domain: %s/%s", tenant_name, bd_name)
             else:
                 # Check VRF change (cross-tenant reference)
                 extra = {}
@@ -143,12 +148,11 @@ class BridgeDomainSyncModule(BaseSyncModule):
                     self.netbox.update_bridge_domain,
                 )
 
-            bd_map = self.context.setdefault('bd_map', {})
-            bd_map[f"{tenant_name}/{bd_name}"] = bd.id
+            self._bd_map[(tenant_name, bd_name)] = bd.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync Bridge Domain {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync Bridge Domain %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
@@ -157,6 +161,8 @@ class BridgeDomainSyncModule(BaseSyncModule):
 class SubnetSyncModule(BaseSyncModule):
     """Sync ACI Bridge Domain Subnets to NetBox."""
 
+    ACI_GETTERS = ('get_subnets',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -168,6 +174,10 @@ class SubnetSyncModule(BaseSyncModule):
     def object_type(self) -> str:
         return "Subnet"
 
+    def pre_sync(self) -> None:
+        """Resolve the BD map once instead of per subnet."""
+        self._bd_map = self.context.get('bd_map', {})
+
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_subnets()
 
@@ -190,18 +200,17 @@ class SubnetSyncModule(BaseSyncModule):
             tenant_name = aci_data.get('tenant')
             bd_name = aci_data.get('bridge_domain')
             if not tenant_name or not bd_name:
-                logger.warning(f"Skipping subnet without tenant/BD: {aci_data}")
+                logger.warning("Skipping subnet without tenant/BD: %s", aci_data)
                 return False
 
-            bd_map = self.context.get('bd_map', {})
-            bd_id = bd_map.get(f"{tenant_name}/{bd_name}")
+            bd_id = self._bd_map.get((tenant_name, bd_name))
             if not bd_id:
-                logger.warning(f"BD {tenant_name}/{bd_name} not found for subnet")
+                logger.warning("BD %s/%s not found for subnet", tenant_name, bd_name)
                 return False
 
             subnet_ip = aci_data.get('ip')
             if not subnet_ip:
-                logger.warning(f"Skipping subnet without IP: {aci_data}")
+                logger.warning("Skipping subnet without IP: %s", aci_data)
                 return False
 
             # Create/get the parent prefix in IPAM (e.g., 10.1.1.1/24 -> 10.1.1.0/24)
@@ -213,9 +222,9 @@ class SubnetSyncModule(BaseSyncModule):
                     description=f"BD Subnet - {bd_name}"
                 )
                 if prefix_created:
-                    logger.info(f"Created prefix in IPAM: {prefix_str}")
+                    logger.info("Created prefix in IPAM: %s", prefix_str)
             except ValueError as e:
-                logger.warning(f"Could not derive prefix from {subnet_ip}: {e}")
+                logger.warning("Could not derive prefix from %s: %s", subnet_ip, e)
 
             # Create/get gateway IP in IPAM with Anycast role
             ip_obj, ip_created = self.netbox.get_or_create_ip_address(
@@ -224,7 +233,7 @@ class SubnetSyncModule(BaseSyncModule):
                 role='anycast'
             )
             if ip_created:
-                logger.debug(f"Created IP address in IPAM: {subnet_ip} (role=anycast)")
+                logger.debug("Created IP address in IPAM: %s (role=anycast)", subnet_ip)
             else:
                 # Ensure existing IP has role set to anycast
                 current_role = getattr(ip_obj, 'role', None)
@@ -232,9 +241,9 @@ class SubnetSyncModule(BaseSyncModule):
                 if current_role_val != 'anycast':
                     try:
                         ip_obj.update({'role': 'anycast'})
-                        logger.debug(f"Updated IP {subnet_ip} role to anycast")
+                        logger.debug("Updated IP %s role to anycast", subnet_ip)
                     except Exception as e:
-                        logger.warning(f"Could not update IP {subnet_ip} role to anycast: {e}")
+                        logger.warning("Could not update IP %s role to anycast: %s", subnet_ip, e)
 
             subnet_name = aci_data.get('name') or f"{bd_name}-{subnet_ip.replace('/', '_')}"
 
@@ -251,7 +260,7 @@ class SubnetSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created Subnet: {subnet_ip} in BD {bd_name}")
+                logger.info("Created Subnet: %s in BD %s", subnet_ip, bd_name)
             else:
                 # Check BD change
                 extra = {}
@@ -273,7 +282,7 @@ class SubnetSyncModule(BaseSyncModule):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync Subnet {aci_data.get('ip')}: {e}")
+            logger.error("Failed to sync Subnet %s: %s", aci_data.get('ip'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
\ No newline at end of file
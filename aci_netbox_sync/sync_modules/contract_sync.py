@@ -8,7 +8,7 @@ Optimized with:
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .base import BaseSyncModule
 
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 class ContractFilterSyncModule(BaseSyncModule):
     """Sync ACI Contract Filters to NetBox."""
 
+    ACI_GETTERS = ('get_contract_filters',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -29,12 +31,13 @@ class ContractFilterSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Pre-fetch existing filters per tenant."""
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._filter_map = self.context.setdefault('filter_map', {})
         self._tenant_filter_caches: Dict[int, Dict] = {}
-        tenant_map = self.context.get('tenant_map', {})
-        for tenant_name, tenant_id in tenant_map.items():
+        for tenant_name, tenant_id in self._tenant_map.items():
             cache = self.netbox.fetch_all_contract_filters(tenant_id)
             self._tenant_filter_caches[tenant_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} filters for tenant {tenant_name}")
+            logger.debug("Pre-fetched %d filters for tenant %s", len(cache), tenant_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_contract_filters()
@@ -43,18 +46,17 @@ class ContractFilterSyncModule(BaseSyncModule):
         try:
             tenant_name = aci_data.get('tenant')
             if not tenant_name:
-                logger.warning(f"Skipping filter without tenant: {aci_data}")
+                logger.warning("Skipping filter without tenant: %s", aci_data)
                 return False
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
+            tenant_id = self._tenant_map.get(tenant_name)
             if not tenant_id:
-                logger.warning(f"Tenant {tenant_name} not found for filter")
+                logger.warning("Tenant %s not found for filter", tenant_name)
                 return False
 
             filter_name = aci_data.get('name')
             if not filter_name:
-                logger.warning(f"Skipping filter without name: {aci_data}")
+                logger.warning("Skipping filter without name: %s", aci_data)
                 return False
 
             filter_params = self._build_params(aci_data)
@@ -67,7 +69,7 @@ class ContractFilterSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created Contract Filter: {tenant_name}/{filter_name}")
+                logger.info("Created Contract Filter: %s/%s", tenant_name, filter_name)
             else:
                 updates = self._build_updates(flt, aci_data)
                 self._apply_updates(
@@ -76,8 +78,7 @@ class ContractFilterSyncModule(BaseSyncModule):
                     self.netbox.update_contract_filter,
                 )
 
-            filter_map = self.context.setdefault('filter_map', {})
-            filter_map[f"{tenant_name}/{filter_name}"] = flt.id
+            self._filter_map[(tenant_name, filter_name)] = flt.id
 
             # Sync filter entries
             for entry_data in aci_data.get('entries', []):
@@ -86,7 +87,7 @@ class ContractFilterSyncModule(BaseSyncModule):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync Contract Filter {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync Contract Filter %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
@@ -117,17 +118,19 @@ class ContractFilterSyncModule(BaseSyncModule):
                 filter_id=filter_id, name=entry_name, **entry_params
             )
             if created:
-                logger.info(f"Created Filter Entry: {filter_name}/{entry_name}")
+                logger.info("Created Filter Entry: %s/%s", filter_name, entry_name)
             return True
 
         except Exception as e:
-            logger.debug(f"Failed to sync Filter Entry {entry_data.get('name')}: {e}")
+            logger.debug("Failed to sync Filter Entry %s: %s", entry_data.get('name'), e)
             return False
 
 
 class ContractSyncModule(BaseSyncModule):
     """Sync ACI Contracts to NetBox."""
 
+    ACI_GETTERS = ('get_contracts',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -142,12 +145,14 @@ class ContractSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Pre-fetch existing contracts per tenant."""
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._contract_map = self.context.setdefault('contract_map', {})
+        self._subject_map = self.context.setdefault('subject_map', {})
         self._tenant_contract_caches: Dict[int, Dict] = {}
-        tenant_map = self.context.get('tenant_map', {})
-        for tenant_name, tenant_id in tenant_map.items():
+        for tenant_name, tenant_id in self._tenant_map.items():
             cache = self.netbox.fetch_all_contracts(tenant_id)
             self._tenant_contract_caches[tenant_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} contracts for tenant {tenant_name}")
+            logger.debug("Pre-fetched %d contracts for tenant %s", len(cache), tenant_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_contracts()
@@ -156,18 +161,17 @@ class ContractSyncModule(BaseSyncModule):
         try:
             tenant_name = aci_data.get('tenant')
             if not tenant_name:
-                logger.warning(f"Skipping contract without tenant: {aci_data}")
+                logger.warning("Skipping contract without tenant: %s", aci_data)
                 return False
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
+            tenant_id = self._tenant_map.get(tenant_name)
             if not tenant_id:
-                logger.warning(f"Tenant {tenant_name} not found for contract")
+                logger.warning("Tenant %s not found for contract", tenant_name)
                 return False
 
             contract_name = aci_data.get('name')
             if not contract_name:
-                logger.warning(f"Skipping contract without name: {aci_data}")
+                logger.warning("Skipping contract without name: %s", aci_data)
                 return False
 
             contract_params = self._build_params(aci_data)
@@ -180,7 +184,7 @@ class ContractSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created Contract: {tenant_name}/{contract_name}")
+                logger.info("Created Contract: %s/%s", tenant_name, contract_name)
             else:
                 updates = self._build_updates(contract, aci_data)
                 self._apply_updates(
@@ -189,8 +193,7 @@ class ContractSyncModule(BaseSyncModule):
                     self.netbox.update_contract,
                 )
 
-            contract_map = self.context.setdefault('contract_map', {})
-            contract_map[f"{tenant_name}/{contract_name}"] = contract.id
+            self._contract_map[(tenant_name, contract_name)] = contract.id
 
             # Sync subjects
             for subject_data in aci_data.get('subjects', []):
@@ -199,7 +202,7 @@ class ContractSyncModule(BaseSyncModule):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync Contract {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync Contract %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
@@ -220,7 +223,7 @@ class ContractSyncModule(BaseSyncModule):
             )
 
             if created:
-                logger.info(f"Created Contract Subject: {contract_name}/{subject_name}")
+                logger.info("Created Contract Subject: %s/%s", contract_name, subject_name)
             else:
                 if subject_data.get('description'):
                     if getattr(subject, 'description', None) != subject_data['description']:
@@ -229,14 +232,13 @@ class ContractSyncModule(BaseSyncModule):
                             {'description': subject_data['description']},
                             self.settings.verify_updates,
                         )
-                        logger.info(f"Updated Contract Subject: {contract_name}/{subject_name}")
+                        logger.info("Updated Contract Subject: %s/%s", contract_name, subject_name)
 
-            subject_map = self.context.setdefault('subject_map', {})
-            subject_map[f"{tenant_name}/{contract_name}/{subject_name}"] = subject.id
+            self._subject_map[(tenant_name, contract_name, subject_name)] = subject.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync Contract Subject {subject_data.get('name')}: {e}")
+            logger.error("Failed to sync Contract Subject %s: %s", subject_data.get('name'), e)
             return False
 
 
@@ -248,16 +250,26 @@ class ContractRelationshipSyncModule(BaseSyncModule):
     instead of querying per relationship (was O(n²), now O(n)).
     """
 
+    ACI_GETTERS = ('get_contract_relationships',)
+
     @property
     def object_type(self) -> str:
         return "ContractRelationship"
 
     def pre_sync(self) -> None:
         """Pre-fetch all contract relations into the NetBox client cache."""
+        # Relationships already attempted this run, keyed by
+        # (contract_id, epg_id or vrf_id, role, is_vzany)
+        self._posted: set = set()
+        self._fabric_id = self.context.get('fabric_id')
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._contract_map = self.context.get('contract_map', {})
+        self._vrf_map = self.context.get('vrf_map', {})
+        self._epg_map = self.context.get('epg_map', {})
         # Force the cache to populate before we start syncing
-        self.netbox._fetch_contract_relations()
-        count = len(self.netbox._contract_relations_cache or [])
-        logger.info(f"Pre-fetched {count} existing contract relations")
+        relations = self.netbox._fetch_contract_relations()
+        if relations is not None:
+            logger.info("Pre-fetched %s existing contract relations", len(relations))
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         relationships = self.aci.get_contract_relationships()
@@ -282,10 +294,26 @@ class ContractRelationshipSyncModule(BaseSyncModule):
                 epg_count += 1
 
         if vzany_count > 0:
-            logger.info(f"Found {epg_count} EPG relationships and {vzany_count} vzAny relationships")
+            logger.info(
+                "Found %s EPG relationships and %s vzAny relationships",
+                epg_count, vzany_count
+            )
 
         return result
 
+    def _is_duplicate(self, key: Tuple) -> bool:
+        """
+        Return True if this relationship was already handled this run.
+
+        ACI reports the same relationship from several query angles; only
+        the first occurrence is sent to NetBox.
+        """
+        if key in self._posted:
+            self.result.unchanged += 1
+            return True
+        self._posted.add(key)
+        return False
+
     def sync_object(self, aci_data: Dict[str, Any]) -> bool:
         try:
             contract_name = aci_data.get('contract')
@@ -297,22 +325,18 @@ class ContractRelationshipSyncModule(BaseSyncModule):
             role_map = {'provider': 'prov', 'consumer': 'cons'}
             netbox_role = role_map.get(role, role)
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
-
-            fabric_map = self.context.get('fabric_map', {})
-            fabric_id = list(fabric_map.values())[0] if fabric_map else None
+            tenant_id = self._tenant_map.get(tenant_name)
+            fabric_id = self._fabric_id
 
-            contract_map = self.context.get('contract_map', {})
-            contract_id = contract_map.get(f"{tenant_name}/{contract_name}")
+            contract_id = self._contract_map.get((tenant_name, contract_name))
 
             if not contract_id:
-                contract_id = contract_map.get(f"common/{contract_name}")
+                contract_id = self._contract_map.get(('common', contract_name))
                 if contract_id:
-                    tenant_id = tenant_map.get('common', tenant_id)
+                    tenant_id = self._tenant_map.get('common', tenant_id)
 
             if not contract_id:
-                logger.debug(f"Contract {contract_name} not found for relationship")
+                logger.debug("Contract %s not found for relationship", contract_name)
                 return False
 
             is_vzany = aci_data.get('is_vzany', False)
@@ -322,12 +346,14 @@ class ContractRelationshipSyncModule(BaseSyncModule):
                 if not vrf_name:
                     return False
 
-                vrf_map = self.context.get('vrf_map', {})
-                vrf_id = vrf_map.get(f"{tenant_name}/{vrf_name}")
+                vrf_id = self._vrf_map.get((tenant_name, vrf_name))
                 if not vrf_id:
-                    logger.debug(f"VRF {vrf_name} not found for vzAny relationship")
+                    logger.debug("VRF %s not found for vzAny relationship", vrf_name)
                     return False
 
+                if self._is_duplicate((contract_id, vrf_id, netbox_role, True)):
+                    return True
+
                 try:
                     created = self.netbox.create_vrf_contract_relation(
                         vrf_id=vrf_id, contract_id=contract_id,
@@ -335,11 +361,11 @@ class ContractRelationshipSyncModule(BaseSyncModule):
                     )
                     if created:
                         self.result.created += 1
-                        logger.info(f"Created vzAny {role}: VRF {vrf_name} -> {contract_name}")
+                        logger.info("Created vzAny %s: VRF %s -> %s", role, vrf_name, contract_name)
                     else:
                         self.result.unchanged += 1
                 except Exception as e:
-                    logger.debug(f"Could not create VRF contract relation: {e}")
+                    logger.debug("Could not create VRF contract relation: %s", e)
                     self.result.unchanged += 1
             else:
                 ap_name = aci_data.get('ap')
@@ -347,12 +373,14 @@ class ContractRelationshipSyncModule(BaseSyncModule):
                 if not ap_name or not epg_name:
                     return False
 
-                epg_map = self.context.get('epg_map', {})
-                epg_id = epg_map.get(f"{tenant_name}/{ap_name}/{epg_name}")
+                epg_id = self._epg_map.get((tenant_name, ap_name, epg_name))
                 if not epg_id:
-                    logger.debug(f"EPG {epg_name} not found for contract relationship")
+                    logger.debug("EPG %s not found for contract relationship", epg_name)
                     return False
 
+                if self._is_duplicate((contract_id, epg_id, netbox_role, False)):
+                    return True
+
                 try:
                     created = self.netbox.create_contract_relation(
                         contract_id=contract_id, epg_id=epg_id,
@@ -361,16 +389,16 @@ class ContractRelationshipSyncModule(BaseSyncModule):
                     )
                     if created:
                         self.result.created += 1
-                        logger.info(f"Created {role}: EPG {epg_name} -> {contract_name}")
+                        logger.info("Created %s: EPG %s -> %s", role, epg_name, contract_name)
                     else:
                         self.result.unchanged += 1
                 except Exception as e:
-                    logger.debug(f"Could not create contract relation: {e}")
+                    logger.debug("Could not create contract relation: %s", e)
                     self.result.unchanged += 1
 
             return True
 
         except Exception as e:
-            logger.debug(f"Failed to sync contract relationship: {e}")
+            logger.debug("Failed to sync contract relationship: %s", e)
             self.result.unchanged += 1
             return True  # Don't fail the whole sync
\ No newline at end of file
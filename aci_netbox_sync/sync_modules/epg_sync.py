@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class EPGSyncModule(BaseSyncModule):
     """Sync ACI Endpoint Groups to NetBox."""
 
+    ACI_GETTERS = ('get_epgs',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -36,12 +38,14 @@ class EPGSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Pre-fetch existing EPGs per AP."""
+        self._ap_map = self.context.get('ap_map', {})
+        self._bd_map = self.context.get('bd_map', {})
+        self._epg_map = self.context.setdefault('epg_map', {})
         self._ap_epg_caches: Dict[int, Dict] = {}
-        ap_map = self.context.get('ap_map', {})
-        for ap_key, ap_id in ap_map.items():
+        for (tenant_name, ap_name), ap_id in self._ap_map.items():
             cache = self.netbox.fetch_all_epgs(ap_id)
             self._ap_epg_caches[ap_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} EPGs for AP {ap_key}")
+            logger.debug("Pre-fetched %d EPGs for AP %s/%s", len(cache), tenant_name, ap_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_epgs()
@@ -51,34 +55,35 @@ class EPGSyncModule(BaseSyncModule):
             tenant_name = aci_data.get('tenant')
             ap_name = aci_data.get('app_profile')
             if not tenant_name or not ap_name:
-                logger.warning(f"Skipping EPG without tenant/AP: {aci_data}")
+                logger.warning("Skipping EPG without tenant/AP: %s", aci_data)
                 return False
 
-            ap_map = self.context.get('ap_map', {})
-            ap_id = ap_map.get(f"{tenant_name}/{ap_name}")
+            ap_id = self._ap_map.get((tenant_name, ap_name))
             if not ap_id:
-                logger.warning(f"AP {tenant_name}/{ap_name} not found for EPG")
+                logger.warning("AP %s/%s not found for EPG", tenant_name, ap_name)
                 return False
 
             bd_name = aci_data.get('bridge_domain')
-            bd_map = self.context.get('bd_map', {})
-            bd_id = bd_map.get(f"{tenant_name}/{bd_name}") if bd_name else None
+            bd_id = self._bd_map.get((tenant_name, bd_name)) if bd_name else None
             if not bd_id:
                 epg_name = aci_data.get('name')
                 if bd_name:
-                    logger.warning(f"BD {bd_name} not found for EPG {epg_name} - skipping")
+                    logger.warning("BD %s not found for EPG %s - skipping", bd_name, epg_name)
                 else:
-                    logger.warning(f"EPG {tenant_name}/{ap_name}/{epg_name} has no BD - skipping")
+                    logger.warning(
+                        "EPG %s/%s/%s has no BD - skipping",
+                        tenant_name, ap_name, epg_name
+                    )
                 return False
 
             epg_name = aci_data.get('name')
             if not epg_name:
-                logger.warning(f"Skipping EPG without name: {aci_data}")
+                logger.warning("Skipping EPG without name: %s", aci_data)
                 return False
 
             # Skip uSeg EPGs
             if aci_data.get('is_attr_based_epg'):
-                logger.debug(f"Skipping uSeg EPG: {epg_name}")
+                logger.debug("Skipping uSeg EPG: %s", epg_name)
                 return True
 
             epg_params = self._build_params(aci_data)
@@ -96,7 +101,7 @@ class EPGSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created EPG: {tenant_name}/{ap_name}/{epg_name}")
+                logger.info("Created EPG: %s/%s/%s", tenant_name, ap_name, epg_name)
             else:
                 # Check BD change
                 extra = {}
@@ -112,12 +117,11 @@ class EPGSyncModule(BaseSyncModule):
                     self.netbox.update_epg,
                 )
 
-            epg_map = self.context.setdefault('epg_map', {})
-            epg_map[f"{tenant_name}/{ap_name}/{epg_name}"] = epg.id
+            self._epg_map[(tenant_name, ap_name, epg_name)] = epg.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync EPG {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync EPG %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
\ No newline at end of file
@@ -3,11 +3,12 @@ ESG Sync Module - Synchronize ACI Endpoint Security Groups to NetBox.
 
 Optimized with:
 - FIELD_MAP / CONVERTERS for DRY field comparison
-- Per-AP pre-fetch caching
+- Single flat pre-fetch of all ESGs keyed by (ap_id, name)
+- Bulk create/update of ESGs, flushed after the sync loop
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .base import BaseSyncModule
 
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 class ESGSyncModule(BaseSyncModule):
     """Sync ACI Endpoint Security Groups to NetBox."""
 
+    ACI_GETTERS = ('get_esgs',)
+
+    __slots__ = ('_ap_map', '_vrf_map', '_esg_map', '_esg_cache')
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -29,18 +34,24 @@ class ESGSyncModule(BaseSyncModule):
         'pref_gr_memb': lambda v: v == 'include',
     }
 
+    _dedupe_key = staticmethod(lambda d: (d.get('tenant'), d.get('app_profile'), d.get('name')))
+
     @property
     def object_type(self) -> str:
         return "EndpointSecurityGroup"
 
     def pre_sync(self) -> None:
-        """Pre-fetch existing ESGs per AP."""
-        self._ap_esg_caches: Dict[int, Dict] = {}
-        ap_map = self.context.get('ap_map', {})
-        for ap_key, ap_id in ap_map.items():
-            cache = self.netbox.fetch_all_esgs(ap_id)
-            self._ap_esg_caches[ap_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} ESGs for AP {ap_key}")
+        """Pre-fetch the synced tenants' ESGs in one query, keyed by (ap_id, name)."""
+        self._ap_map = self.context.get('ap_map', {})
+        self._vrf_map = self.context.get('vrf_map', {})
+        self._esg_map = self.context.setdefault('esg_map', {})
+        tenant_ids = list(self.context.get('tenant_map', {}).values())
+        self._esg_cache: Dict[Tuple[int, str], Any] = self.netbox.fetch_all_esgs_flat(tenant_ids)
+        logger.debug("Pre-fetched %d ESGs", len(self._esg_cache))
+
+    def refresh_caches(self) -> None:
+        """Re-fetch ESGs that may have changed during a long sync."""
+        self.pre_sync()
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_esgs()
@@ -50,52 +61,53 @@ class ESGSyncModule(BaseSyncModule):
             tenant_name = aci_data.get('tenant')
             ap_name = aci_data.get('app_profile')
             if not tenant_name or not ap_name:
-                logger.warning(f"Skipping ESG without tenant/AP: {aci_data}")
+                logger.warning("Skipping ESG without tenant/AP: %s", aci_data)
                 return False
 
-            ap_map = self.context.get('ap_map', {})
-            ap_id = ap_map.get(f"{tenant_name}/{ap_name}")
+            ap_id = self._ap_map.get((tenant_name, ap_name))
             if not ap_id:
-                logger.warning(f"AP {tenant_name}/{ap_name} not found for ESG")
+                logger.warning("AP %s/%s not found for ESG", tenant_name, ap_name)
                 return False
 
             vrf_name = aci_data.get('vrf')
-            vrf_map = self.context.get('vrf_map', {})
-            vrf_id = vrf_map.get(f"{tenant_name}/{vrf_name}") if vrf_name else None
+            vrf_id = self._vrf_map.get((tenant_name, vrf_name)) if vrf_name else None
             if not vrf_id and vrf_name:
-                logger.warning(f"VRF {vrf_name} not found for ESG {aci_data.get('name')}")
+                logger.warning("VRF %s not found for ESG %s", vrf_name, aci_data.get('name'))
 
             esg_name = aci_data.get('name')
             if not esg_name:
-                logger.warning(f"Skipping ESG without name: {aci_data}")
+                logger.warning("Skipping ESG without name: %s", aci_data)
                 return False
 
-            esg_params = self._build_params(aci_data)
-
-            # Use per-AP cache
-            cache = self._ap_esg_caches.get(ap_id, {})
-            esg, created = self.netbox.get_or_create_esg_cached(
-                cache, esg_name,
-                ap_id=ap_id, vrf_id=vrf_id, **esg_params
-            )
-
-            if created:
-                self.result.created += 1
-                logger.info(f"Created ESG: {tenant_name}/{ap_name}/{esg_name}")
+            esg_key = (tenant_name, ap_name, esg_name)
+            esg_label = f"{tenant_name}/{ap_name}/{esg_name}"
+            endpoint = self.netbox.aci_plugin.endpoint_security_groups
+
+            # The pre-fetched cache is authoritative: a miss means the ESG is new
+            cache_key = (ap_id, esg_name)
+            esg = self._esg_cache.get(cache_key)
+
+            if esg is None:
+                def on_created(record, cache_key=cache_key, esg_key=esg_key):
+                    self._esg_cache[cache_key] = record
+                    self._esg_map[esg_key] = record.id
+
+                self._queue_create(
+                    endpoint,
+                    {'aci_app_profile': ap_id, 'aci_vrf': vrf_id, 'name': esg_name,
+                     **self._build_params(aci_data)},
+                    esg_label,
+                    key=esg_key,
+                    on_created=on_created,
+                )
             else:
                 updates = self._build_updates(esg, aci_data)
-                self._apply_updates(
-                    esg, updates,
-                    f"{tenant_name}/{ap_name}/{esg_name}",
-                    self.netbox.update_esg,
-                )
-
-            esg_map = self.context.setdefault('esg_map', {})
-            esg_map[f"{tenant_name}/{ap_name}/{esg_name}"] = esg.id
+                self._queue_update(endpoint, esg, updates, esg_label, self.netbox.update_esg)
+                self._esg_map[esg_key] = esg.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync ESG {aci_data.get('name')}: {e}")
+            logger.error("Failed to sync ESG %s: %s", aci_data.get('name'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
\ No newline at end of file
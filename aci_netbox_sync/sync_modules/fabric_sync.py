@@ -5,15 +5,42 @@ Includes fabric details: fabric_id, infra_vlan_id, gipo_pool (new in 0.2.0).
 Optimized with:
 - Pre-fetch caching for pods and nodes
 - _build_updates for DRY field comparison
+- Bulk create/update of pods and nodes, flushed after the sync loop
+- Node pre-fetches issued concurrently rather than back to back
+- Missing TEP IPs created in bulk before nodes are dispatched
 """
 
 import logging
-from typing import Any, Dict, List
+import re
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Tuple
 
-from .base import BaseSyncModule, values_equal
+from .base import BaseSyncModule, related_id, snapshot, values_equal
 
 logger = logging.getLogger(__name__)
 
+# Common Cisco/ACI model prefixes (order matters — longest first)
+_MODEL_PREFIX_RE = re.compile(
+    r'^(?:N9K-C|N9K-|N5K-C|N5K-|N3K-C|N3K-|N77-C|N77-|N7K-C|N7K-'
+    r'|APIC-SERVER-|APIC-|Nexus |ACI-)',
+    re.IGNORECASE,
+)
+_MODEL_STRIP_TABLE = str.maketrans('', '', '-_ ')
+
+_ROLE_MAPPING = {
+    'controller': 'apic',
+    'spine': 'spine',
+    'leaf': 'leaf',
+    'unspecified': 'leaf',
+}
+
+# NetBox device role name and fallback device type model per node role
+_ROLE_NAMES = {role: f"ACI {role.title()}" for role in _ROLE_MAPPING.values()}
+_DEFAULT_MODELS = {role: f"ACI-{role.upper()}" for role in _ROLE_MAPPING.values()}
+
+# Characters not allowed in a fabric name
+_FABRIC_NAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
 
 class FabricSyncModule(BaseSyncModule):
     """Sync ACI Fabric settings to NetBox."""
@@ -29,7 +56,7 @@ class FabricSyncModule(BaseSyncModule):
     def sync_object(self, aci_data: Dict[str, Any]) -> bool:
         try:
             raw_name = aci_data.get('name') or 'ACI_Fabric'
-            fabric_name = raw_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+            fabric_name = raw_name.translate(_FABRIC_NAME_TABLE)
 
             fabric_id = aci_data.get('fabric_id') or 1
             infra_vlan_id = aci_data.get('infra_vlan_id') or 4093
@@ -42,15 +69,21 @@ class FabricSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created fabric: {fabric_name}")
+                logger.info("Created fabric: %s", fabric_name)
             else:
+                # Snapshot current values once, then compare locals
+                cur_fabric_id, cur_infra_vlan, cur_gipo_pool = snapshot(
+                    fabric, 'fabric_id', 'infra_vlan_vid', 'gipo_pool'
+                )
+                gipo_pool = aci_data.get('gipo_pool')
+
                 updates = {}
-                if fabric_id and getattr(fabric, 'fabric_id', None) != fabric_id:
+                if fabric_id and cur_fabric_id != fabric_id:
                     updates['fabric_id'] = fabric_id
-                if infra_vlan_id and getattr(fabric, 'infra_vlan_vid', None) != infra_vlan_id:
+                if infra_vlan_id and cur_infra_vlan != infra_vlan_id:
                     updates['infra_vlan_vid'] = infra_vlan_id
-                if aci_data.get('gipo_pool') and getattr(fabric, 'gipo_pool', None) != aci_data['gipo_pool']:
-                    updates['gipo_pool'] = aci_data['gipo_pool']
+                if gipo_pool and cur_gipo_pool != gipo_pool:
+                    updates['gipo_pool'] = gipo_pool
 
                 self._apply_updates(fabric, updates, fabric_name, self.netbox.update_fabric)
 
@@ -59,7 +92,7 @@ class FabricSyncModule(BaseSyncModule):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync fabric: {e}")
+            logger.error("Failed to sync fabric: %s", e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
@@ -68,23 +101,56 @@ class FabricSyncModule(BaseSyncModule):
 class PodSyncModule(BaseSyncModule):
     """Sync ACI Fabric Pods to NetBox."""
 
+    __slots__ = ('_fabric_id', '_pod_map', '_tep_pools', '_tep_pool_prefixes')
+
+    # TEP pools are resolved once before dispatch, so pod workers share no
+    # mutable state beyond the queues
+    PARALLEL_SAFE = True
+
     @property
     def object_type(self) -> str:
         return "Pod"
 
     def pre_sync(self) -> None:
         """Pre-fetch existing pods."""
-        fabric_id = self.context.get('fabric_id')
-        if fabric_id:
-            self._existing_cache = self.netbox.fetch_all_pods(fabric_id)
-            logger.debug(f"Pre-fetched {len(self._existing_cache)} existing pods")
+        self._fabric_id = self.context.get('fabric_id')
+        self._pod_map = self.context.setdefault('pod_map', {})
+        self._tep_pools = self.context.setdefault('tep_pools', set())
+        if self._fabric_id:
+            self._existing_cache = self.netbox.fetch_all_pods(self._fabric_id)
+            logger.debug("Pre-fetched %d existing pods", len(self._existing_cache))
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_fabric_pods()
 
+    def _sync_objects(self, aci_objects: List[Dict[str, Any]]) -> None:
+        # Pods usually share one TEP pool (the fabricSetupP fallback gives
+        # them all the same one). Resolve each distinct pool once, in pod
+        # order, so concurrent workers cannot both miss and create duplicate
+        # prefixes, and the recorded mask does not depend on worker timing.
+        self._tep_pool_prefixes: Dict[str, Any] = {}
+        for aci_data in aci_objects:
+            tep_pool_str = aci_data.get('tep_pool')
+            if not tep_pool_str:
+                continue
+            _, slash, mask = tep_pool_str.partition('/')
+            self.context['tep_pool_mask'] = mask if slash else '16'
+            self._tep_pools.add(tep_pool_str)
+            if tep_pool_str in self._tep_pool_prefixes:
+                continue
+            pod_name = aci_data.get('name') or f"pod-{aci_data.get('pod_id')}"
+            try:
+                self._tep_pool_prefixes[tep_pool_str], _ = self.netbox.get_or_create_prefix(
+                    prefix=tep_pool_str,
+                    description=f"TEP Pool - {pod_name}",
+                )
+            except Exception as e:
+                logger.error("Failed to resolve TEP pool %s: %s", tep_pool_str, e)
+        super()._sync_objects(aci_objects)
+
     def sync_object(self, aci_data: Dict[str, Any]) -> bool:
         try:
-            fabric_id = self.context.get('fabric_id')
+            fabric_id = self._fabric_id
             if not fabric_id:
                 logger.error("Fabric ID not found in context")
                 return False
@@ -92,63 +158,77 @@ class PodSyncModule(BaseSyncModule):
             pod_id = aci_data.get('pod_id')
             pod_name = aci_data.get('name') or f"pod-{pod_id}"
             if not pod_id:
-                logger.warning(f"Skipping pod without ID: {aci_data}")
+                logger.warning("Skipping pod without ID: %s", aci_data)
                 return False
 
             pod_params = {}
             tep_pool_id = None
-            tep_pool_mask = '16'
-            if aci_data.get('tep_pool'):
-                tep_pool_str = aci_data['tep_pool']
-                if '/' in tep_pool_str:
-                    tep_pool_mask = tep_pool_str.split('/')[1]
-
-                tep_pool_obj, _ = self.netbox.get_or_create_prefix(
-                    prefix=aci_data['tep_pool'],
-                    description=f"TEP Pool - {pod_name}",
-                )
+            tep_pool_str = aci_data.get('tep_pool')
+            if tep_pool_str:
+                tep_pool_obj = self._tep_pool_prefixes.get(tep_pool_str)
+                if tep_pool_obj is None:
+                    raise ValueError(f"TEP pool {tep_pool_str} could not be resolved")
                 tep_pool_id = tep_pool_obj.id
                 pod_params['tep_pool'] = tep_pool_id
-                self.context['tep_pool_mask'] = tep_pool_mask
 
-            # Use cached lookup
-            pod, created = self.netbox.get_or_create_pod_cached(
-                self._existing_cache, pod_id,
-                fabric_id=fabric_id, name=pod_name, **pod_params
-            )
+            endpoint = self.netbox.aci_plugin.pods
 
-            if created:
-                self.result.created += 1
-                logger.info(f"Created pod: {pod_name}")
+            # The pre-fetched cache is authoritative: a miss means the pod is new
+            pod = self._existing_cache.get(pod_id)
+
+            if pod is None:
+                def on_created(record, pod_id=pod_id):
+                    self._existing_cache[pod_id] = record
+                    self._pod_map[pod_id] = record.id
+
+                self._queue_create(
+                    endpoint,
+                    {'aci_fabric': fabric_id, 'pod_id': pod_id, 'name': pod_name, **pod_params},
+                    pod_name,
+                    key=pod_id,
+                    on_created=on_created,
+                )
             else:
                 updates = {}
-                if tep_pool_id:
-                    current = getattr(pod, 'tep_pool', None)
-                    current_id = current.id if hasattr(current, 'id') else current
-                    if current_id != tep_pool_id:
-                        updates['tep_pool'] = tep_pool_id
-
-                self._apply_updates(pod, updates, pod_name, self.netbox.update_pod)
+                if tep_pool_id and related_id(pod, 'tep_pool') != tep_pool_id:
+                    updates['tep_pool'] = tep_pool_id
 
-            pod_map = self.context.setdefault('pod_map', {})
-            pod_map[pod_id] = pod.id
+                self._queue_update(endpoint, pod, updates, pod_name, self.netbox.update_pod)
+                self._pod_map[pod_id] = pod.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync pod: {e}")
-            self.result.failed += 1
-            self.result.errors.append(str(e))
+            logger.error("Failed to sync pod: %s", e)
+            self._record_failure(str(e))
             return False
 
 
 class NodeSyncModule(BaseSyncModule):
     """Sync ACI Fabric Nodes to NetBox (new in 0.2.0)."""
 
+    __slots__ = (
+        '_fabric_id', '_pod_map', '_node_map', '_tep_pool_mask', '_existing_by_name',
+        '_manufacturer', '_site', '_device_type_cache', '_device_role_cache',
+        '_normalized_device_types', '_tep_ip_cache', '_dcim_device_cache',
+    )
+
+    # Each node is independent once pre_sync has run; the shared DCIM
+    # helper caches are guarded by self._lock
+    PARALLEL_SAFE = True
+
+    # Applied to the derived node values, not the raw ACI data
+    FIELD_MAP = {
+        'role': 'role',
+        'tep_ip_address': 'tep_ip_address',
+    }
+
+    _dedupe_key = staticmethod(lambda d: d.get('node_id'))
+
+    # Includes the case variants APIC reports so lookups need no .lower()
     ROLE_MAPPING = {
-        'controller': 'apic',
-        'spine': 'spine',
-        'leaf': 'leaf',
-        'unspecified': 'leaf',
+        variant: nb_role
+        for aci_role, nb_role in _ROLE_MAPPING.items()
+        for variant in (aci_role, aci_role.upper(), aci_role.title())
     }
 
     @property
@@ -156,6 +236,7 @@ class NodeSyncModule(BaseSyncModule):
         return "Node"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize_model(model: str) -> str:
         """
         Normalize an ACI/Cisco model string to a canonical form for matching.
@@ -172,49 +253,69 @@ class NodeSyncModule(BaseSyncModule):
             APIC-M3           -> m3
             ACI-LEAF          -> leaf
         """
-        s = model.strip()
-
-        # Strip common Cisco/ACI prefixes (order matters — longest first)
-        for prefix in ('N9K-C', 'N9K-', 'N5K-C', 'N5K-', 'N3K-C', 'N3K-',
-                       'N77-C', 'N77-', 'N7K-C', 'N7K-',
-                       'APIC-SERVER-', 'APIC-',
-                       'Nexus ', 'nexus ',
-                       'ACI-'):
-            if s.startswith(prefix) or s.lower().startswith(prefix.lower()):
-                s = s[len(prefix):]
-                break
-
-        # Lowercase, strip hyphens/spaces/underscores for comparison
-        return s.lower().replace('-', '').replace(' ', '').replace('_', '')
+        # Strip one known prefix, then lowercase and drop hyphens/spaces/underscores
+        s = _MODEL_PREFIX_RE.sub('', model.strip(), count=1)
+        return s.lower().translate(_MODEL_STRIP_TABLE)
 
     def pre_sync(self) -> None:
         """Pre-fetch existing nodes and cache DCIM helper objects."""
-        fabric_id = self.context.get('fabric_id')
-        if fabric_id:
-            self._existing_cache = self.netbox.fetch_all_nodes(fabric_id)
-            logger.debug(f"Pre-fetched {len(self._existing_cache)} existing nodes")
-
-        # Cache Cisco manufacturer and site once (instead of per-node)
-        self._manufacturer, _ = self.netbox.get_or_create_manufacturer("Cisco")
+        self._fabric_id = self.context.get('fabric_id')
+        self._pod_map = self.context.get('pod_map', {})
+        self._node_map = self.context.setdefault('node_map', {})
+        self._tep_pool_mask = self.context.get('tep_pool_mask', '16')
+        self._device_role_cache: Dict[str, Any] = {}
+        self._dcim_device_cache: Dict[str, Any] = {}
         fabric_name = self.context.get('fabric_name', 'ACI-Fabric')
-        self._site, _ = self.netbox.get_or_create_site(fabric_name)
+        tep_pools = list(self.context.get('tep_pools', ()))
+
+        # These fetches are independent, so overlap their round trips.
+        # Manufacturer and site are cached once instead of per-node.
+        _, _, (self._site, _), *tep_ip_maps = self._run_concurrently(
+            self._load_nodes,
+            self._load_manufacturer,
+            partial(self.netbox.get_or_create_site, fabric_name),
+            *(partial(self.netbox.fetch_ip_addresses_in_prefix, pool) for pool in tep_pools),
+        )
 
-        # Pre-fetch all existing Cisco device types and build normalized index
-        self._device_type_cache: Dict[str, Any] = {}
-        self._device_role_cache: Dict[str, Any] = {}
+        # Existing TEP IPs, so only missing ones need a round trip
+        self._tep_ip_cache: Dict[str, Any] = {}
+        for ip_map in tep_ip_maps:
+            self._tep_ip_cache.update(ip_map)
+        logger.debug("Pre-fetched %d existing TEP IPs", len(self._tep_ip_cache))
+
+    def refresh_caches(self) -> None:
+        """Re-fetch nodes and device types that may have changed during a long sync."""
+        self._load_nodes()
+        self._load_device_types()
+
+    def _load_nodes(self) -> None:
+        if self._fabric_id:
+            self._existing_cache = self.netbox.fetch_all_nodes(self._fabric_id)
+            logger.debug("Pre-fetched %d existing nodes", len(self._existing_cache))
+        # Nodes may already exist under the same name with a different node ID
+        self._existing_by_name: Dict[str, Any] = {
+            getattr(n, 'name', None): n for n in self._existing_cache.values()
+        }
+
+    def _load_manufacturer(self) -> None:
+        self._manufacturer, _ = self.netbox.get_or_create_manufacturer("Cisco")
+        self._load_device_types()
 
+    def _load_device_types(self) -> None:
+        """Pre-fetch all existing Cisco device types and build normalized index."""
         existing_types = self.netbox.fetch_all_device_types(self._manufacturer.id)
-        self._normalized_device_types: Dict[str, Any] = {}
-        for dt in existing_types:
-            model_str = getattr(dt, 'model', '') or ''
-            norm = self._normalize_model(model_str)
-            if norm:
-                self._normalized_device_types[norm] = dt
-                # Also cache by exact model so later lookups hit the cache
-                self._device_type_cache[model_str] = dt
+        self._normalized_device_types: Dict[str, Any] = {
+            norm: dt for dt in existing_types
+            if (norm := self._normalize_model(getattr(dt, 'model', '') or ''))
+        }
+        # Also cache by exact model so later lookups hit the cache
+        self._device_type_cache: Dict[str, Any] = {
+            model: dt for dt in existing_types
+            if (model := getattr(dt, 'model', '') or '')
+        }
         logger.debug(
-            f"Pre-fetched {len(existing_types)} Cisco device types, "
-            f"{len(self._normalized_device_types)} normalized entries"
+            "Pre-fetched %d Cisco device types, %d normalized entries",
+            len(existing_types), len(self._normalized_device_types)
         )
 
     def _get_device_type(self, model: str) -> Any:
@@ -226,84 +327,164 @@ class NodeSyncModule(BaseSyncModule):
         2. Normalized match against pre-fetched Cisco device types
         3. Create new device type if no match found
         """
-        # 1. Exact cache hit
-        if model in self._device_type_cache:
-            return self._device_type_cache[model]
-
-        # 2. Normalized match against existing NetBox device types
-        norm = self._normalize_model(model)
-        if norm and norm in self._normalized_device_types:
-            dt = self._normalized_device_types[norm]
-            existing_model = getattr(dt, 'model', model)
-            logger.info(
-                f"Matched ACI model '{model}' to existing NetBox device type '{existing_model}'"
+        with self._lock:
+            # 1. Exact cache hit
+            if model in self._device_type_cache:
+                return self._device_type_cache[model]
+
+            # 2. Normalized match against existing NetBox device types
+            norm = self._normalize_model(model)
+            if norm and norm in self._normalized_device_types:
+                dt = self._normalized_device_types[norm]
+                existing_model = getattr(dt, 'model', model)
+                logger.info(
+                    "Matched ACI model '%s' to existing NetBox device type '%s'",
+                    model, existing_model
+                )
+                self._device_type_cache[model] = dt
+                return dt
+
+            # 3. No match — create new device type
+            logger.debug("No existing device type match for '%s', creating new", model)
+            dt, _ = self.netbox.get_or_create_device_type(
+                manufacturer_id=self._manufacturer.id, model=model
             )
             self._device_type_cache[model] = dt
+            # Also register in normalized index so future ACI models can match
+            if norm:
+                self._normalized_device_types[norm] = dt
             return dt
 
-        # 3. No match — create new device type
-        logger.debug(f"No existing device type match for '{model}', creating new")
-        dt, _ = self.netbox.get_or_create_device_type(
-            manufacturer_id=self._manufacturer.id, model=model
-        )
-        self._device_type_cache[model] = dt
-        # Also register in normalized index so future ACI models can match
-        if norm:
-            self._normalized_device_types[norm] = dt
-        return dt
-
     def _get_device_role(self, role_name: str) -> Any:
         """Get or create device role with caching."""
-        if role_name not in self._device_role_cache:
-            dr, _ = self.netbox.get_or_create_device_role(role_name)
-            self._device_role_cache[role_name] = dr
-        return self._device_role_cache[role_name]
+        with self._lock:
+            if role_name not in self._device_role_cache:
+                dr, _ = self.netbox.get_or_create_device_role(role_name)
+                self._device_role_cache[role_name] = dr
+            return self._device_role_cache[role_name]
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
-        return self.aci.get_fabric_nodes()
+        return self._get_fabric_nodes()
+
+    @staticmethod
+    def _node_name(aci_data: Dict[str, Any]) -> str:
+        return aci_data.get('name') or f"node-{aci_data.get('node_id')}"
+
+    def _node_role_and_model(self, aci_data: Dict[str, Any]) -> Tuple[str, str]:
+        aci_role = aci_data.get('role') or 'leaf'
+        node_role = self.ROLE_MAPPING.get(aci_role) or self.ROLE_MAPPING.get(aci_role.lower(), 'leaf')
+        return node_role, aci_data.get('model') or _DEFAULT_MODELS[node_role]
+
+    def _will_sync(self, aci_data: Dict[str, Any]) -> bool:
+        """Whether sync_object gets past its fabric/node/pod checks for a node."""
+        return bool(
+            self._fabric_id
+            and aci_data.get('node_id')
+            and self._pod_map.get(aci_data.get('pod_id', 1))
+        )
+
+    def _sync_objects(self, aci_objects: List[Dict[str, Any]]) -> None:
+        # Resolve each distinct device role and type once up front, so the
+        # per-node workers only hit the caches instead of queueing on the lock.
+        # Only nodes that will be synced count, so skipped nodes create nothing.
+        syncable = [aci_data for aci_data in aci_objects if self._will_sync(aci_data)]
+        roles, models = set(), set()
+        for aci_data in syncable:
+            node_role, model = self._node_role_and_model(aci_data)
+            roles.add(node_role)
+            models.add(model)
+        # A failure here is left uncached, so sync_object retries it and only
+        # the nodes of that role/model fail
+        for node_role in roles:
+            try:
+                self._get_device_role(_ROLE_NAMES[node_role])
+            except Exception as e:
+                logger.warning("Could not resolve device role %s: %s", node_role, e)
+        for model in models:
+            try:
+                self._get_device_type(model)
+            except Exception as e:
+                logger.warning("Could not resolve device type %s: %s", model, e)
+
+        # One query for the DCIM devices backing all nodes instead of a GET per
+        # node. A miss falls back to get_or_create_dcim_device, so a failed
+        # pre-fetch only costs the per-node lookups.
+        try:
+            self._dcim_device_cache = self.netbox.fetch_dcim_devices_by_name(
+                self._node_name(aci_data) for aci_data in syncable
+            )
+        except Exception as e:
+            logger.warning("Could not pre-fetch DCIM devices, looking them up per node: %s", e)
+            self._dcim_device_cache = {}
+        self._create_missing_tep_ips(syncable)
+        super()._sync_objects(aci_objects)
+
+    def _create_missing_tep_ips(self, aci_objects: List[Dict[str, Any]]) -> None:
+        """Create the TEP IPs NetBox does not have yet with bulk POSTs."""
+        missing: Dict[str, Dict[str, Any]] = {}
+        for aci_data in aci_objects:
+            tep_address = aci_data.get('address')
+            if not tep_address or tep_address == '0.0.0.0':
+                continue
+            tep_ip_only = tep_address.split('/')[0]
+            if tep_ip_only not in self._tep_ip_cache and tep_ip_only not in missing:
+                missing[tep_ip_only] = {
+                    'address': f"{tep_ip_only}/{self._tep_pool_mask}",
+                    'description': f"TEP IP - {self._node_name(aci_data)}",
+                }
+        if not missing:
+            return
+
+        # Addresses outside the pre-fetched TEP pools may still exist
+        self._tep_ip_cache.update(self.netbox.fetch_ip_addresses(missing))
+        to_create = [payload for ip, payload in missing.items() if ip not in self._tep_ip_cache]
+        endpoint = self.netbox.api.ipam.ip_addresses
+        for chunk in self._chunks(to_create):
+            # A failed batch leaves its IPs to the per-node get_or_create path
+            for record in self.netbox.bulk_create(endpoint, chunk):
+                self._tep_ip_cache[str(record.address).split('/')[0]] = record
 
     def sync_object(self, aci_data: Dict[str, Any]) -> bool:
         try:
-            fabric_id = self.context.get('fabric_id')
+            fabric_id = self._fabric_id
             if not fabric_id:
                 logger.error("Fabric ID not found in context")
                 return False
 
             node_id = aci_data.get('node_id')
-            node_name = aci_data.get('name') or f"node-{node_id}"
+            node_name = self._node_name(aci_data)
             if not node_id:
-                logger.warning(f"Skipping node without ID: {aci_data}")
+                logger.warning("Skipping node without ID: %s", aci_data)
                 return False
 
             pod_id = aci_data.get('pod_id', 1)
-            pod_map = self.context.get('pod_map', {})
-            aci_pod_id = pod_map.get(pod_id)
+            aci_pod_id = self._pod_map.get(pod_id)
             if not aci_pod_id:
-                logger.warning(f"Pod {pod_id} not found for node {node_name}, skipping")
+                logger.warning("Pod %s not found for node %s, skipping", pod_id, node_name)
                 return False
 
-            aci_role = aci_data.get('role', 'leaf').lower()
-            node_role = self.ROLE_MAPPING.get(aci_role, 'leaf')
-            model = aci_data.get('model') or f"ACI-{node_role.upper()}"
+            node_role, model = self._node_role_and_model(aci_data)
 
             # Use cached DCIM helpers
             device_type = self._get_device_type(model)
-            role_name = f"ACI {node_role.title()}"
-            device_role = self._get_device_role(role_name)
+            device_role = self._get_device_role(_ROLE_NAMES[node_role])
 
             device_params = {}
             if aci_data.get('serial'):
                 device_params['serial'] = aci_data['serial']
 
-            dcim_device, device_created = self.netbox.get_or_create_dcim_device(
-                name=node_name,
-                device_type_id=device_type.id,
-                site_id=self._site.id,
-                role_id=device_role.id,
-                **device_params,
-            )
-            if device_created:
-                logger.debug(f"Created DCIM device: {node_name}")
+            dcim_device = self._dcim_device_cache.get(node_name)
+            if dcim_device is None:
+                dcim_device, device_created = self.netbox.get_or_create_dcim_device(
+                    name=node_name,
+                    device_type_id=device_type.id,
+                    site_id=self._site.id,
+                    role_id=device_role.id,
+                    **device_params,
+                )
+                if device_created:
+                    logger.debug("Created DCIM device: %s", node_name)
+                self._dcim_device_cache[node_name] = dcim_device
 
             node_params = {
                 'name': node_name,
@@ -314,60 +495,61 @@ class NodeSyncModule(BaseSyncModule):
                 'node_object_id': dcim_device.id,
             }
 
+            # The pre-fetched cache is authoritative: a miss means the node is new
+            node = self._existing_cache.get(node_id) or self._existing_by_name.get(node_name)
+
             # Handle TEP IP
             tep_address = aci_data.get('address')
             tep_ip_id = None
             if tep_address and tep_address != '0.0.0.0':
-                tep_pool_mask = self.context.get('tep_pool_mask', '16')
                 tep_ip_only = tep_address.split('/')[0] if '/' in tep_address else tep_address
-                tep_address_with_mask = f"{tep_ip_only}/{tep_pool_mask}"
-
-                try:
-                    tep_ip_obj, _ = self.netbox.get_or_create_ip_address(
-                        address=tep_address_with_mask,
-                        description=f"TEP IP - {node_name}",
-                    )
+                tep_address_with_mask = f"{tep_ip_only}/{self._tep_pool_mask}"
+
+                # Unchanged TEP on an existing node needs no IPAM lookup at all
+                existing_tep = vars(node).get('tep_ip_address') if node else None
+                if existing_tep and str(getattr(existing_tep, 'address', '')) == tep_address_with_mask:
+                    tep_ip_obj = existing_tep
+                else:
+                    tep_ip_obj = self._tep_ip_cache.get(tep_ip_only)
+                if tep_ip_obj is None:
+                    # Only reached when the bulk pre-create missed this address;
+                    # get_or_create_ip_address already searches before creating
+                    try:
+                        tep_ip_obj, _ = self.netbox.get_or_create_ip_address(
+                            address=tep_address_with_mask,
+                            description=f"TEP IP - {node_name}",
+                        )
+                        self._tep_ip_cache[tep_ip_only] = tep_ip_obj
+                    except Exception as e:
+                        logger.warning("Could not create TEP IP %s: %s", tep_address_with_mask, e)
+
+                if tep_ip_obj:
                     tep_ip_id = tep_ip_obj.id
                     node_params['tep_ip_address'] = tep_ip_id
-                except Exception as e:
-                    logger.warning(f"Could not create TEP IP {tep_address_with_mask}: {e}")
-                    try:
-                        existing_ip = self.netbox.api.ipam.ip_addresses.get(address=tep_ip_only)
-                        if existing_ip:
-                            tep_ip_id = existing_ip.id
-                            node_params['tep_ip_address'] = tep_ip_id
-                    except Exception as e2:
-                        logger.debug(f"Could not find existing TEP IP: {e2}")
-
-            # Use cached lookup
-            node, created = self.netbox.get_or_create_node_cached(
-                self._existing_cache, node_id,
-                fabric_id=fabric_id, **node_params
-            )
 
-            if created:
-                self.result.created += 1
-                logger.info(f"Created node: {node_name} (ID: {node_id})")
-            else:
-                updates = {}
-                current_role = getattr(node, 'role', None)
-                if str(current_role) if current_role else '' != node_role:
-                    updates['role'] = node_role
+            endpoint = self.netbox.aci_plugin.nodes
 
-                if tep_ip_id:
-                    current_tep = getattr(node, 'tep_ip_address', None)
-                    current_tep_id = current_tep.id if hasattr(current_tep, 'id') else current_tep
-                    if current_tep_id != tep_ip_id:
-                        updates['tep_ip_address'] = tep_ip_id
+            if node is None:
+                def on_created(record, node_id=node_id):
+                    self._existing_cache[node_id] = record
+                    self._node_map[node_id] = record.id
 
-                self._apply_updates(node, updates, node_name, self.netbox.update_node)
-
-            node_map = self.context.setdefault('node_map', {})
-            node_map[node_id] = node.id
+                self._queue_create(
+                    endpoint,
+                    {'aci_fabric': fabric_id, 'node_id': node_id, **node_params},
+                    f"{node_name} (ID: {node_id})",
+                    key=node_id,
+                    on_created=on_created,
+                )
+            else:
+                updates = self._build_updates(
+                    node, {'role': node_role, 'tep_ip_address': tep_ip_id}
+                )
+                self._queue_update(endpoint, node, updates, node_name, self.netbox.update_node)
+                self._node_map[node_id] = node.id
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync node {aci_data.get('name')}: {e}")
-            self.result.failed += 1
-            self.result.errors.append(str(e))
+            logger.error("Failed to sync node %s: %s", aci_data.get('name'), e)
+            self._record_failure(str(e))
             return False
\ No newline at end of file
@@ -17,10 +17,14 @@ Requires: netbox-software-tracker plugin v0.3.7+
           (https://pypi.org/project/netbox-software-tracker/)
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple
 
-from .base import BaseSyncModule
+from .base import BaseSyncModule, snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +38,44 @@ class SoftwareVersionSyncModule(BaseSyncModule):
 
     def pre_sync(self) -> None:
         """Fetch firmware details (filenames, checksums) from APIC before syncing."""
+        self._sw_version_map = self.context.setdefault('sw_version_map', {})
         try:
             self._firmware_details = self.aci.get_firmware_details()
-            logger.info(
-                f"Loaded firmware details for {len(self._firmware_details)} version(s)"
-            )
+            logger.info("Loaded firmware details for %d version(s)", len(self._firmware_details))
         except Exception as e:
-            logger.warning(f"Could not fetch firmware details: {e}")
+            logger.warning("Could not fetch firmware details: %s", e)
             self._firmware_details = {}
+        # Versions whose details carry anything worth copying onto a device
+        self._versions_with_metadata = frozenset(
+            version for version, details in self._firmware_details.items()
+            if details.get('filename') or details.get('checksum')
+        )
+        self._assigned_golden_images = self._load_golden_image_cache()
+
+    def _load_golden_image_cache(self) -> Set[str]:
+        path = self.settings.golden_image_cache
+        if not path:
+            return set()
+        try:
+            with open(path) as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Ignoring unreadable golden image cache %s: %s", path, e)
+            return set()
+
+    def _save_golden_image_cache(self) -> None:
+        path = self.settings.golden_image_cache
+        if not path:
+            return
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(sorted(self._assigned_golden_images), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write golden image cache %s: %s", path, e)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         """
@@ -50,17 +84,14 @@ class SoftwareVersionSyncModule(BaseSyncModule):
         Returns a deduplicated list of version records. Each record includes
         the version string and the list of nodes running that version.
         """
-        nodes = self.aci.get_fabric_nodes()
+        nodes = self._get_fabric_nodes()
 
         # Group nodes by firmware version
-        version_map: Dict[str, List[Dict[str, Any]]] = {}
+        version_map: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
         for node in nodes:
             version = node.get('version')
             if not version or version in ('unknown', 'n/a', ''):
                 continue
-
-            if version not in version_map:
-                version_map[version] = []
             version_map[version].append(node)
 
         # Build deduplicated version records
@@ -73,8 +104,8 @@ class SoftwareVersionSyncModule(BaseSyncModule):
             })
 
         logger.info(
-            f"Found {len(result)} unique ACI firmware version(s) "
-            f"across {len(nodes)} node(s)"
+            "Found %d unique ACI firmware version(s) across %d node(s)",
+            len(result), len(nodes)
         )
         return result
 
@@ -83,7 +114,7 @@ class SoftwareVersionSyncModule(BaseSyncModule):
         try:
             version = aci_data.get('version')
             if not version:
-                logger.warning(f"Skipping entry without version: {aci_data}")
+                logger.warning("Skipping entry without version: %s", aci_data)
                 return False
 
             nodes = aci_data.get('nodes', [])
@@ -101,8 +132,8 @@ class SoftwareVersionSyncModule(BaseSyncModule):
             version_str = version[:32]
 
             # Look up firmware details from APIC (filename, checksum)
-            fw_details = getattr(self, '_firmware_details', {}).get(version, {})
-            
+            fw_details = self._firmware_details.get(version, {})
+
             # Build create/update kwargs with available firmware metadata
             sw_kwargs = {
                 'comments': comments,
@@ -126,24 +157,22 @@ class SoftwareVersionSyncModule(BaseSyncModule):
 
             if created:
                 self.result.created += 1
-                logger.info(f"Created software version: {version_str}")
+                logger.info("Created software version: %s", version_str)
             else:
                 # Check if comments need updating (node list may have changed)
+                current_comments, current_fn, current_md5 = snapshot(
+                    sw_image, 'comments', 'filename', 'md5sum'
+                )
                 updates = {}
-                current_comments = getattr(sw_image, 'comments', None) or ''
                 if current_comments != comments:
                     updates['comments'] = comments
 
                 # Check if filename/checksum need updating (from APIC firmware repo)
-                if filename:
-                    current_fn = getattr(sw_image, 'filename', None) or ''
-                    if current_fn != filename[:256]:
-                        updates['filename'] = filename[:256]
+                if filename and current_fn != filename[:256]:
+                    updates['filename'] = filename[:256]
 
-                if checksum:
-                    current_md5 = getattr(sw_image, 'md5sum', None) or ''
-                    if current_md5 != checksum[:36]:
-                        updates['md5sum'] = checksum[:36]
+                if checksum and current_md5 != checksum[:36]:
+                    updates['md5sum'] = checksum[:36]
 
                 if updates:
                     changed, verified = self.netbox.update_software_image(
@@ -153,20 +182,19 @@ class SoftwareVersionSyncModule(BaseSyncModule):
                         self.result.updated += 1
                         if verified:
                             self.result.verified += 1
-                        logger.info(f"Updated software version: {version_str}")
+                        logger.info("Updated software version: %s", version_str)
                     else:
                         self.result.unchanged += 1
                 else:
                     self.result.unchanged += 1
 
             # Store version -> software-image ID mapping in context
-            sw_version_map = self.context.setdefault('sw_version_map', {})
-            sw_version_map[version] = sw_image.id
+            self._sw_version_map[version] = sw_image.id
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync software version {aci_data.get('version')}: {e}")
+            logger.error("Failed to sync software version %s: %s", aci_data.get('version'), e)
             self.result.failed += 1
             self.result.errors.append(str(e))
             return False
@@ -178,72 +206,55 @@ class SoftwareVersionSyncModule(BaseSyncModule):
            via local_context_data so it's visible on the device page.
         2. Assign golden images to device types.
         """
-        sw_version_map = self.context.get('sw_version_map', {})
+        sw_version_map = self._sw_version_map
         if not sw_version_map:
             return
 
         # Collect node data for both assignments
         try:
-            nodes = self.aci.get_fabric_nodes()
+            nodes = self._get_fabric_nodes()
         except Exception as e:
-            logger.warning(f"Could not re-fetch nodes for software assignment: {e}")
+            logger.warning("Could not re-fetch nodes for software assignment: %s", e)
             return
 
+        # One query each for all devices and device types instead of one per node
+        devices_by_name, types_by_model = self._run_concurrently(
+            partial(self._fetch_or_lookup,
+                    self.netbox.fetch_dcim_devices_by_name, self.netbox.get_dcim_device_by_name,
+                    {n['name'] for n in nodes if n.get('name')}),
+            partial(self._fetch_or_lookup,
+                    self.netbox.fetch_device_types_by_model, self.netbox.get_device_type_by_model,
+                    {n['model'] for n in nodes if n.get('model')}),
+        )
+
         # --- Step 1: Assign version to individual devices ---
-        devices_updated = 0
+        pending = []
         for node in nodes:
-            version = node.get('version')
-            node_name = node.get('name')
-            if not version or not node_name:
-                continue
+            device = devices_by_name.get(node.get('name'))
+            merged_ctx = self._firmware_context(node, device)
+            if merged_ctx is not None:
+                pending.append((device, merged_ctx))
 
-            try:
-                device = self.netbox.get_dcim_device_by_name(node_name)
-                if not device:
-                    logger.debug(f"DCIM device not found for node {node_name}")
-                    continue
-
-                # Build firmware context data
-                firmware_context = {
-                    'firmware': {
-                        'version': version,
-                        'model': node.get('model', ''),
-                        'serial': node.get('serial', ''),
-                    }
-                }
-                
-                # Add filename and checksum if available from APIC
-                fw_details = getattr(self, '_firmware_details', {}).get(version, {})
-                if fw_details.get('filename'):
-                    firmware_context['firmware']['filename'] = fw_details['filename']
-                if fw_details.get('checksum'):
-                    firmware_context['firmware']['checksum'] = fw_details['checksum']
-
-                # Get current local_context_data and merge
-                current_ctx = getattr(device, 'local_context_data', None) or {}
-                current_firmware = current_ctx.get('firmware', {})
-
-                if current_firmware != firmware_context['firmware']:
-                    # Merge - preserve any other keys in local_context_data
-                    merged_ctx = dict(current_ctx)
-                    merged_ctx['firmware'] = firmware_context['firmware']
-
-                    device.update({'local_context_data': merged_ctx})
+        # One PATCH per batch; fall back to per-device updates if a batch fails
+        devices_updated = 0
+        endpoint = self.netbox.api.dcim.devices
+        for chunk in self._chunks(pending):
+            payload = [{'id': device.id, 'local_context_data': ctx} for device, ctx in chunk]
+            if self.netbox.bulk_update(endpoint, payload):
+                devices_updated += len(chunk)
+                continue
+            for device, ctx in chunk:
+                try:
+                    device.update({'local_context_data': ctx})
                     devices_updated += 1
-                    logger.debug(
-                        f"Set firmware {version} on device {node_name}"
-                    )
-
-            except Exception as e:
-                logger.debug(f"Could not set firmware on device {node_name}: {e}")
+                except Exception as e:
+                    logger.debug("Could not set firmware on device %s: %s", device.name, e)
 
         if devices_updated:
-            logger.info(
-                f"Updated firmware version on {devices_updated} device(s)"
-            )
+            logger.info("Updated firmware version on %s device(s)", devices_updated)
 
         # --- Step 2: Assign golden images to device types ---
-        assigned = 0
+        golden_pending: Dict[str, Tuple[str, int, int]] = {}
         seen_device_types = set()  # Avoid duplicate assignments per model
         for node in nodes:
             version = node.get('version')
@@ -261,20 +272,105 @@ class SoftwareVersionSyncModule(BaseSyncModule):
             if not sw_image_id:
                 continue
 
-            try:
-                device_type = self.netbox.get_device_type_by_model(model)
-                if not device_type:
-                    continue
+            device_type = types_by_model.get(model)
+            if not device_type:
+                continue
 
-                success = self.netbox.assign_golden_image(
-                    software_image_id=sw_image_id,
-                    device_type_id=device_type.id,
-                )
-                if success:
-                    assigned += 1
+            # Assignments made by earlier runs need no round trip
+            cache_key = f"{model}:{version}:{sw_image_id}:{device_type.id}"
+            if cache_key not in self._assigned_golden_images:
+                golden_pending[cache_key] = (model, sw_image_id, device_type.id)
 
-            except Exception as e:
-                logger.debug(f"Could not assign golden image for {model}: {e}")
+        # Each assignment is an independent GET + POST, so overlap them
+        assigned = 0
+        cache_changed = False
+        if golden_pending:
+            results = self._run_concurrently(
+                *(partial(self._assign_golden_image, item) for item in golden_pending.items())
+            )
+            for cache_key, created in results:
+                if created is not None:
+                    self._assigned_golden_images.add(cache_key)
+                    cache_changed = True
+                if created:
+                    assigned += 1
 
+        if cache_changed:
+            self._save_golden_image_cache()
         if assigned:
-            logger.info(f"Assigned golden images to {assigned} device type(s)")
\ No newline at end of file
+            logger.info("Assigned golden images to %s device type(s)", assigned)
+
+    @staticmethod
+    def _fetch_or_lookup(
+        fetch_many: Callable[[Set[str]], Dict[str, Any]],
+        get_one: Callable[[str], Optional[Any]],
+        keys: Set[str],
+    ) -> Dict[str, Any]:
+        """
+        Bulk-fetch objects by key, falling back to one lookup per key if the
+        bulk query fails (get_one returns None on errors).
+        """
+        try:
+            return fetch_many(keys)
+        except Exception as e:
+            logger.warning("Bulk lookup failed, falling back to per-object lookups: %s", e)
+        found = {}
+        for key in keys:
+            obj = get_one(key)
+            if obj is not None:
+                found[key] = obj
+        return found
+
+    def _assign_golden_image(
+        self, item: Tuple[str, Tuple[str, int, int]]
+    ) -> Tuple[str, Optional[bool]]:
+        """Run one pending golden image assignment; returns (cache_key, created)."""
+        cache_key, (model, sw_image_id, device_type_id) = item
+        try:
+            return cache_key, self.netbox.assign_golden_image(
+                software_image_id=sw_image_id,
+                device_type_id=device_type_id,
+            )
+        except Exception as e:
+            logger.debug("Could not assign golden image for %s: %s", model, e)
+            return cache_key, None
+
+    def _firmware_context(self, node: Dict[str, Any], device: Any) -> Optional[Dict[str, Any]]:
+        """
+        Return the device's local_context_data with the node's running firmware
+        merged in, or None if the device is missing or already up to date.
+        """
+        version = node.get('version')
+        node_name = node.get('name')
+        if not version or not node_name:
+            return None
+
+        if not device:
+            logger.debug("DCIM device not found for node %s", node_name)
+            return None
+
+        # Build firmware context data
+        firmware = {
+            'version': version,
+            'model': node.get('model', ''),
+            'serial': node.get('serial', ''),
+        }
+
+        # Add filename and checksum if available from APIC
+        if version in self._versions_with_metadata:
+            fw_details = self._firmware_details[version]
+            if fw_details.get('filename'):
+                firmware['filename'] = fw_details['filename']
+            if fw_details.get('checksum'):
+                firmware['checksum'] = fw_details['checksum']
+
+        # Get current local_context_data and merge
+        current_ctx = getattr(device, 'local_context_data', None) or {}
+        if current_ctx.get('firmware', {}) == firmware:
+            return None
+
+        # Merge - preserve any other keys in local_context_data
+        merged_ctx = dict(current_ctx)
+        merged_ctx['firmware'] = firmware
+        logger.debug("Set firmware %s on device %s", version, node_name)
+        return merged_ctx
@@ -3,10 +3,12 @@ VRF Sync Module - Synchronize ACI VRFs (Contexts) to NetBox.
 
 Optimized with:
 - FIELD_MAP / CONVERTERS for DRY field comparison
-- Per-tenant pre-fetch caching
+- Per-tenant pre-fetch caching, fetched concurrently
+- Bulk create/update of VRFs, flushed after the sync loop
 """
 
 import logging
+from functools import partial
 from typing import Any, Dict, List
 
 from .base import BaseSyncModule
@@ -17,6 +19,8 @@ logger = logging.getLogger(__name__)
 class VRFSyncModule(BaseSyncModule):
     """Sync ACI VRFs to NetBox."""
 
+    ACI_GETTERS = ('get_vrfs',)
+
     FIELD_MAP = {
         'name_alias': 'name_alias',
         'description': 'description',
@@ -38,13 +42,17 @@ class VRFSyncModule(BaseSyncModule):
         return "VRF"
 
     def pre_sync(self) -> None:
-        """Pre-fetch existing VRFs per tenant."""
+        """Pre-fetch existing VRFs per tenant, tenants in parallel."""
+        self._tenant_map = self.context.get('tenant_map', {})
+        self._vrf_map = self.context.setdefault('vrf_map', {})
         self._tenant_vrf_caches: Dict[int, Dict] = {}
-        tenant_map = self.context.get('tenant_map', {})
-        for tenant_name, tenant_id in tenant_map.items():
-            cache = self.netbox.fetch_all_vrfs(tenant_id)
+        tenants = list(self._tenant_map.items())
+        caches = self._run_concurrently(
+            *(partial(self.netbox.fetch_all_vrfs, tenant_id) for _, tenant_id in tenants)
+        )
+        for (tenant_name, tenant_id), cache in zip(tenants, caches):
             self._tenant_vrf_caches[tenant_id] = cache
-            logger.debug(f"Pre-fetched {len(cache)} VRFs for tenant {tenant_name}")
+            logger.debug("Pre-fetched %d VRFs for tenant %s", len(cache), tenant_name)
 
     def fetch_from_aci(self) -> List[Dict[str, Any]]:
         return self.aci.get_vrfs()
@@ -53,49 +61,47 @@ class VRFSyncModule(BaseSyncModule):
         try:
             tenant_name = aci_data.get('tenant')
             if not tenant_name:
-                logger.warning(f"Skipping VRF without tenant: {aci_data}")
+                logger.warning("Skipping VRF without tenant: %s", aci_data)
                 return False
 
-            tenant_map = self.context.get('tenant_map', {})
-            tenant_id = tenant_map.get(tenant_name)
+            tenant_id = self._tenant_map.get(tenant_name)
             if not tenant_id:
-                logger.warning(f"Tenant {tenant_name} not found for VRF {aci_data.get('name')}")
+                logger.warning("Tenant %s not found for VRF %s", tenant_name, aci_data.get('name'))
                 return False
 
             vrf_name = aci_data.get('name')
             if not vrf_name:
-                logger.warning(f"Skipping VRF without name: {aci_data}")
+                logger.warning("Skipping VRF without name: %s", aci_data)
                 return False
 
-            # Build params using field map + converters
-            vrf_params = self._build_params(aci_data)
-
-            # Use per-tenant cache
-            cache = self._tenant_vrf_caches.get(tenant_id, {})
-            vrf, created = self.netbox.get_or_create_vrf_cached(
-                cache, vrf_name,
-                tenant_id=tenant_id, **vrf_params
-            )
-
-            if created:
-                self.result.created += 1
-                logger.info(f"Created VRF: {tenant_name}/{vrf_name}")
+            vrf_label = f"{tenant_name}/{vrf_name}"
+            vrf_key = (tenant_name, vrf_name)
+            endpoint = self.netbox.aci_plugin.vrfs
+
+            # The pre-fetched per-tenant cache is authoritative: a miss means the VRF is new
+            cache = self._tenant_vrf_caches.setdefault(tenant_id, {})
+            vrf = cache.get(vrf_name)
+
+            if vrf is None:
+                def on_created(record, cache=cache, vrf_name=vrf_name, vrf_key=vrf_key):
+                    cache[vrf_name] = record
+                    self._vrf_map[vrf_key] = record.id
+
+                self._queue_create(
+                    endpoint,
+                    {'aci_tenant': tenant_id, 'name': vrf_name, **self._build_params(aci_data)},
+                    vrf_label,
+                    key=vrf_key,
+                    on_created=on_created,
+                )
             else:
                 updates = self._build_updates(vrf, aci_data)
-                self._apply_updates(
-                    vrf, updates,
-                    f"{tenant_name}/{vrf_name}",
-                    self.netbox.update_vrf,
-                )
-
-            # Store VRF mapping
-            vrf_map = self.context.setdefault('vrf_map', {})
-            vrf_map[f"{tenant_name}/{vrf_name}"] = vrf.id
+                self._queue_update(endpoint, vrf, updates, vrf_label, self.netbox.update_vrf)
+                self._vrf_map[vrf_key] = vrf.id
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync VRF {aci_data.get('name')}: {e}")
-            self.result.failed += 1
-            self.result.errors.append(str(e))
+            logger.error("Failed to sync VRF %s: %s", aci_data.get('name'), e)
+            self._record_failure(str(e))
             return False
\ No newline at end of file
@@ -4,7 +4,10 @@ Provides efficient data retrieval from Cisco ACI using Cobra SDK.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Generator
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional, Generator, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 import urllib3
 
@@ -28,7 +31,15 @@ except ImportError as e:
     LoginSession = None
     DnQuery = None
     ClassQuery = None
-    logger.warning(f"Cobra SDK (acicobra) not available: {e}")
+    logger.warning("Cobra SDK (acicobra) not available: %s", e)
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
 
 # Model imports are optional - we use class queries by string name
 # so we don't strictly need the model classes imported
@@ -37,7 +48,276 @@ try:
     MODELS_AVAILABLE = True
 except ImportError as e:
     MODELS_AVAILABLE = False
-    logger.debug(f"Cobra model classes not imported (this is OK): {e}")
+    logger.debug("Cobra model classes not imported (this is OK): %s", e)
+
+# Model classes of the children the parsers pick out of children subtrees.
+# Without the model package, children are matched by class name instead.
+_CHILD_MODEL_CLASSES = {'Subj': vz.Subj, 'Entry': vz.Entry} if MODELS_AVAILABLE else {}
+
+# Tenant-scoped classes read by the tenant getters, with the subtree each
+# parser needs. Those of the scheduled modules are fetched together by
+# prefetch(), so a full sync waits for one round of concurrent queries
+# instead of one per module.
+_TENANT_CLASSES = {
+    'fvTenant': None,
+    'fvCtx': None,
+    'fvBD': None,
+    'fvRsCtx': None,
+    'fvSubnet': None,
+    'fvAp': None,
+    'fvAEPg': None,
+    'fvRsBd': None,
+    'fvESg': None,
+    'fvRsScope': None,
+    'vzFilter': 'children',
+    'vzBrCP': 'children',
+    'fvRsProv': None,
+    'fvRsCons': None,
+    'vzRsAnyToProv': None,
+    'vzRsAnyToCons': None,
+}
+
+# Tenant-scoped classes each getter reads, for prefetch()
+_GETTER_TENANT_CLASSES = {
+    'get_tenants': ('fvTenant',),
+    'get_vrfs': ('fvCtx',),
+    'get_bridge_domains': ('fvBD', 'fvRsCtx'),
+    'get_subnets': ('fvSubnet',),
+    'get_app_profiles': ('fvAp',),
+    'get_epgs': ('fvAEPg', 'fvRsBd'),
+    'get_esgs': ('fvESg', 'fvRsScope'),
+    'get_contract_filters': ('vzFilter',),
+    'get_contracts': ('vzBrCP',),
+    'get_contract_relationships': ('fvRsProv', 'fvRsCons', 'vzRsAnyToProv', 'vzRsAnyToCons'),
+}
+
+# The tenant object parsers only read configured properties and naming,
+# so the APIC can leave runtime state out of those (large) responses. The
+# relation classes are fetched in full: their resolved target (tDn) is not
+# a configured property and would be dropped by config-only.
+_TENANT_PROP_INCLUDES = {
+    name: 'config-only'
+    for name in _TENANT_CLASSES
+    if not name.startswith(('fvRs', 'vzRs'))
+}
+
+# Upper bound on concurrent class queries sent to the APIC
+_MAX_QUERY_WORKERS = 8
+
+# Contract relation classes: (class, relationships bucket, is vzAny)
+_CONTRACT_RELATIONS = (
+    ('fvRsProv', 'providers', False),
+    ('fvRsCons', 'consumers', False),
+    ('vzRsAnyToProv', 'providers', True),
+    ('vzRsAnyToCons', 'consumers', True),
+)
+
+
+# Tenant/AP/EPG/BD/VRF components of a DN, matched in one pass. Each
+# alternative is anchored at a '/' so names such as "rsprov-tn-x" are not
+# mistaken for components.
+_DN_RE = re.compile(
+    r"(?:^|/)(?:tn-(?P<tn>[^/]+)|ap-(?P<ap>[^/]+)|epg-(?P<epg>[^/]+)"
+    r"|BD-(?P<bd>[^/]+)|ctx-(?P<ctx>[^/]+))"
+)
+
+
+def _parse_dn(dn: str) -> Dict[str, str]:
+    """
+    Return the tn/ap/epg/bd/ctx components of a DN that are present.
+    Names are interned, since the same tenant/AP/BD recurs across many rows.
+    """
+    return {m.lastgroup: sys.intern(m.group(m.lastgroup)) for m in _DN_RE.finditer(dn)}
+
+
+def _tenant_from_dn(dn: str) -> Optional[str]:
+    """Return the interned tenant name of a uni/tn-<name>/... DN."""
+    _, found, rest = dn.partition('/tn-')
+    return sys.intern(rest.partition('/')[0]) if found else None
+
+
+def _str_or_none(mo: Any, attr: str) -> Optional[str]:
+    """Return an MO property as a string, or None if it is missing or empty."""
+    value = getattr(mo, attr, None)
+    return str(value) if value else None
+
+
+def _children_of(mo: Any, class_name: str) -> List[Any]:
+    """Return the children of an MO that are of the given Cobra class."""
+    children = getattr(mo, 'children', ())
+    model_class = _CHILD_MODEL_CLASSES.get(class_name)
+    if model_class is not None:
+        return [child for child in children if isinstance(child, model_class)]
+    return [child for child in children if type(child).__name__ == class_name]
+
+
+# Sentinel for MO properties that are not present at all
+_MISSING = object()
+
+
+def _parse_mo(mo: Any, spec: Tuple[Tuple[str, str, Any, Optional[str]], ...]) -> Dict[str, Any]:
+    """
+    Build a row dict from an MO according to a field spec.
+
+    Each spec entry is (row key, MO property, default, truthy value). A
+    missing property takes the default. With a truthy value the field is a
+    bool comparing the property against it; otherwise it is the property
+    as a string, or None if the default is None and the property is empty.
+    Properties with a default are enum-like ('flood', 'unspecified', ...)
+    and are interned so identical values share one string across rows.
+    """
+    row = {}
+    for key, attr, default, truthy in spec:
+        value = getattr(mo, attr, _MISSING)
+        if value is _MISSING:
+            row[key] = default
+        elif truthy is not None:
+            row[key] = str(value) == truthy
+        elif default is None:
+            row[key] = str(value) if value else None
+        else:
+            row[key] = sys.intern(str(value))
+    return row
+
+
+# Field specs for _parse_mo(), one per parsed ACI class
+_NAMED_FIELDS = (
+    ('name_alias', 'nameAlias', None, None),
+    ('description', 'descr', None, None),
+)
+_NODE_FIELDS = (
+    ('name', 'name', None, None),
+    ('serial', 'serial', None, None),
+    ('model', 'model', None, None),
+    ('role', 'role', None, None),
+    ('fabric_st', 'fabricSt', None, None),
+    ('address', 'address', None, None),
+    ('version', 'version', None, None),
+)
+_VRF_FIELDS = _NAMED_FIELDS + (
+    ('bd_enforced_enabled', 'bdEnforcedEnable', False, 'yes'),
+    ('ip_data_plane_learning', 'ipDataPlaneLearning', 'enabled', None),
+    ('pc_enf_dir', 'pcEnfDir', 'ingress', None),
+    ('pc_enf_pref', 'pcEnfPref', 'enforced', None),
+    ('pim_v4_enabled', 'knwMcastAct', False, 'permit'),
+    ('preferred_group', 'vrfPref', False, 'enabled'),
+)
+_BD_FIELDS = _NAMED_FIELDS + (
+    ('arp_flood', 'arpFlood', False, 'yes'),
+    # An empty mode (GARP detection off) must stay '' rather than None, so
+    # that ep_move_detection_enabled=False is still written to NetBox
+    ('ep_move_detect', 'epMoveDetectMode', '', None),
+    ('ip_learning', 'ipLearning', True, 'yes'),
+    ('limit_ip_learn', 'limitIpLearnToSubnets', True, 'yes'),
+    ('mac', 'mac', '00:22:BD:F8:19:FF', None),
+    ('multi_dest_pkt_act', 'multiDstPktAct', 'bd-flood', None),
+    ('unicast_route', 'unicastRoute', True, 'yes'),
+    ('unk_mac_ucast_act', 'unkMacUcastAct', 'proxy', None),
+    ('unk_mcast_act', 'unkMcastAct', 'flood', None),
+    ('v6_unk_mcast_act', 'v6unkMcastAct', 'flood', None),
+    ('vmac', 'vmac', None, None),
+    ('pim_v4_enabled', 'mcastAllow', False, 'yes'),
+    ('host_route_adv', 'hostBasedRouting', False, 'yes'),
+)
+_SUBNET_FIELDS = _NAMED_FIELDS + (
+    ('name', 'name', None, None),
+    ('preferred', 'preferred', False, 'yes'),
+    ('scope', 'scope', 'private', None),
+    ('virtual', 'virtual', False, 'yes'),
+    ('ctrl', 'ctrl', None, None),
+)
+_EPG_FIELDS = _NAMED_FIELDS + (
+    ('pref_gr_memb', 'prefGrMemb', 'exclude', None),
+    ('prio', 'prio', 'unspecified', None),
+    ('pc_enf_pref', 'pcEnfPref', 'unenforced', None),
+    ('flood_on_encap', 'floodOnEncap', False, 'enabled'),
+    ('is_attr_based_epg', 'isAttrBasedEPg', False, 'yes'),
+    ('shutdown', 'shutdown', False, 'yes'),
+)
+_ESG_FIELDS = _NAMED_FIELDS + (
+    ('pref_gr_memb', 'prefGrMemb', 'exclude', None),
+    ('prio', 'prio', 'unspecified', None),
+    ('shutdown', 'shutdown', False, 'yes'),
+)
+_CONTRACT_FIELDS = _NAMED_FIELDS + (
+    ('scope', 'scope', 'context', None),
+    ('prio', 'prio', 'unspecified', None),
+    ('target_dscp', 'targetDscp', 'unspecified', None),
+)
+_FILTER_ENTRY_FIELDS = (
+    ('etherT', 'etherT', 'unspecified', None),
+    ('prot', 'prot', 'unspecified', None),
+    ('dFromPort', 'dFromPort', 'unspecified', None),
+    ('dToPort', 'dToPort', 'unspecified', None),
+    ('sFromPort', 'sFromPort', 'unspecified', None),
+    ('sToPort', 'sToPort', 'unspecified', None),
+)
+
+# Candidate firmware MO properties, in order of preference. Which of them
+# are populated varies by APIC release.
+_FW_FILENAME_ATTRS = ('fwName', 'fileName', 'fullVersion')
+_FW_CHECKSUM_ATTRS = ('checksum', 'md5sum', 'md5')
+_REPO_VERSION_ATTRS = ('version', 'fwVersion', 'name')
+_REPO_FILENAME_ATTRS = ('fileName', 'fwName', 'name', 'fullName')
+_REPO_CHECKSUM_ATTRS = _FW_CHECKSUM_ATTRS + ('digest',)
+_SOURCE_ATTRS = ('url', 'source', 'path')
+
+# Stringified property values that mean "not set"
+_EMPTY_VALUES = frozenset(('', 'None', 'none', 'null', 'NULL'))
+
+
+def _first_attr(mo: Any, attrs: Tuple[str, ...],
+                accept: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+    """
+    Return the first of the given MO properties that is set (and passes
+    accept, if given), as a string, or None.
+    """
+    for attr in attrs:
+        value = getattr(mo, attr, None)
+        if value is None:
+            continue
+        value = str(value)
+        if value not in _EMPTY_VALUES and (accept is None or accept(value)):
+            return value
+    return None
+
+
+def _looks_like_image(name: str) -> bool:
+    """Whether a firmwareFirmware name looks like an image file name."""
+    return '.' in name or 'aci' in name.lower()
+
+
+def _new_firmware_entry(version: str, fw_type: str) -> Dict[str, Any]:
+    """Return an empty get_firmware_details() entry for a version."""
+    return {
+        'version': version,
+        'filename': None,
+        'checksum': None,
+        'type': fw_type,
+        'internal_label': None,
+        'node_dn': None,
+    }
+
+
+# Firmware classes merged by get_firmware_details(), in precedence order:
+# (class, type of versions first seen here, version properties, filename
+#  properties, filename check, checksum properties, describes a node).
+# A class with no type only enriches versions found by the earlier ones.
+_FIRMWARE_SOURCES = (
+    # Switch nodes
+    ('firmwareRunning', 'switch', ('version',),
+     _FW_FILENAME_ATTRS, None, _FW_CHECKSUM_ATTRS, True),
+    # APIC controllers; internalLabel is often the SHA1 build hash
+    ('firmwareCtrlrRunning', 'controller', ('version',),
+     _FW_FILENAME_ATTRS, None, _FW_CHECKSUM_ATTRS, True),
+    # Images staged in the APIC repository, the most likely source of
+    # filenames and checksums on real fabrics
+    ('firmwareFirmware', 'staged', _REPO_VERSION_ATTRS,
+     _REPO_FILENAME_ATTRS, _looks_like_image, _REPO_CHECKSUM_ATTRS, False),
+    # Component (BIOS/CIMC) firmware, for checksums still missing
+    ('firmwareCompRunning', None, ('version',),
+     (), None, _FW_CHECKSUM_ATTRS, False),
+)
 
 
 class ACIClient:
@@ -56,11 +336,12 @@ class ACIClient:
         self._session = None  # LoginSession instance
         self._modir = None    # MoDirectory instance
         self._connected = False
+        self._prefetched: Dict[str, List[Any]] = {}
 
     def connect(self) -> bool:
         """Establish connection to APIC."""
         if not COBRA_AVAILABLE:
-            logger.error(f"Cobra SDK not available. Import error: {COBRA_IMPORT_ERROR}")
+            logger.error("Cobra SDK not available. Import error: %s", COBRA_IMPORT_ERROR)
             logger.error("Please install acicobra package from your APIC or Cisco DevNet")
             return False
 
@@ -72,23 +353,50 @@ class ACIClient:
             )
             self._modir = MoDirectory(self._session)
             self._modir.login()
+            self._tune_http_session()
             self._connected = True
-            logger.info(f"Connected to ACI APIC at {self.host}")
+            logger.info("Connected to ACI APIC at %s", self.host)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to ACI: {e}")
+            logger.error("Failed to connect to ACI: %s", e)
             self._connected = False
             return False
 
+    def _tune_http_session(self) -> None:
+        """
+        Size the pool of Cobra's requests session for concurrent class
+        queries, keep connections alive between queries, ask for
+        compressed responses, and retry throttled requests and transient
+        gateway errors with backoff. Cobra does not expose its session
+        publicly, so this is skipped if it cannot be found.
+        """
+        session = getattr(getattr(self._modir, '_accessImpl', None), '_requests', None)
+        if not REQUESTS_AVAILABLE or not isinstance(session, requests.Session):
+            logger.debug("Cobra HTTP session not found, keeping its default pool")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=_MAX_QUERY_WORKERS,
+            pool_maxsize=_MAX_QUERY_WORKERS,
+            # 429 is the APIC throttling concurrent queries; urllib3 honours
+            # its Retry-After header
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+        )
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        # Class query responses are large and highly repetitive
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+
     def disconnect(self) -> None:
         """Close connection to APIC."""
         if self._modir and self._connected:
             try:
                 self._modir.logout()
             except Exception as e:
-                logger.warning(f"Error during logout: {e}")
+                logger.warning("Error during logout: %s", e)
             finally:
                 self._connected = False
+                self._prefetched = {}
                 logger.info("Disconnected from ACI APIC")
 
     def __enter__(self) -> "ACIClient":
@@ -99,8 +407,12 @@ class ACIClient:
         self.disconnect()
 
     def _query_class(self, class_name: str, subtree: Optional[str] = None, 
-                     prop_filter: Optional[str] = None) -> List[Any]:
-        """Execute a class query and return results."""
+                     prop_filter: Optional[str] = None,
+                     prop_include: Optional[str] = None) -> List[Any]:
+        """
+        Execute a class query and return results. prop_include ('config-only'
+        or 'naming-only') makes the APIC leave out the other properties.
+        """
         if not self._connected or not self._modir:
             raise RuntimeError("Not connected to ACI")
 
@@ -110,11 +422,13 @@ class ACIClient:
             query.subtree = subtree
         if prop_filter:
             query.propFilter = prop_filter
+        if prop_include:
+            query.propInclude = prop_include
         
         try:
             return list(self._modir.query(query))
         except Exception as e:
-            logger.error(f"Query failed for class {class_name}: {e}")
+            logger.error("Query failed for class %s: %s", class_name, e)
             return []
 
     def _query_dn(self, dn: str, subtree: Optional[str] = None) -> Optional[Any]:
@@ -130,9 +444,75 @@ class ACIClient:
             result = self._modir.query(query)
             return result[0] if result else None
         except Exception as e:
-            logger.error(f"Query failed for DN {dn}: {e}")
+            logger.error("Query failed for DN %s: %s", dn, e)
             return None
 
+    def _query_classes(self, *class_names: str,
+                       subtrees: Optional[Dict[str, Optional[str]]] = None,
+                       prop_includes: Optional[Dict[str, str]] = None) -> Dict[str, List[Any]]:
+        """
+        Run independent class queries concurrently and return the results
+        keyed by class name. Each query is its own HTTPS round trip, so the
+        total latency is that of the slowest one rather than their sum.
+        """
+        subtrees = subtrees or {}
+        prop_includes = prop_includes or {}
+        workers = min(len(class_names), _MAX_QUERY_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                lambda name: self._query_class(
+                    name, subtrees.get(name), prop_include=prop_includes.get(name)
+                ),
+                class_names,
+            )
+            return dict(zip(class_names, results))
+
+    def prefetch(self, *getters: str) -> None:
+        """
+        Fetch the tenant-scoped classes read by the given get_* methods in
+        one round of concurrent queries, ahead of the getters being called.
+        Only classes not already prefetched are queried.
+        """
+        class_names = [
+            name
+            for name in dict.fromkeys(
+                name for getter in getters for name in _GETTER_TENANT_CLASSES.get(getter, ())
+            )
+            if name not in self._prefetched
+        ]
+        if class_names:
+            self._prefetched.update(self._query_classes(
+                *class_names, subtrees=_TENANT_CLASSES, prop_includes=_TENANT_PROP_INCLUDES
+            ))
+
+    def _query_tenant_class(self, class_name: str) -> List[Any]:
+        """
+        Return the objects of a tenant-scoped class, from prefetch() if it
+        fetched the class or else with a query of its own. Prefetched results
+        are handed out a single time and then dropped, so the MOs do not
+        outlive their parser. Runtime state is not requested for the classes
+        in _TENANT_PROP_INCLUDES.
+        """
+        objs = self._prefetched.pop(class_name, None)
+        if objs is None:
+            objs = self._query_class(
+                class_name,
+                subtree=_TENANT_CLASSES[class_name],
+                prop_include=_TENANT_PROP_INCLUDES.get(class_name),
+            )
+        return objs
+
+    def _relations_by_parent(self, class_name: str) -> Dict[str, Any]:
+        """
+        Index a tenant-scoped relation class (fvRsCtx, fvRsBd, ...) by the DN
+        of the MO it belongs to, so parents can be queried without their
+        children subtree.
+        """
+        return {
+            str(rs.dn).rsplit('/', 1)[0]: rs
+            for rs in self._query_tenant_class(class_name)
+        }
+
     # Fabric Information Methods
     def get_fabric_settings(self) -> Dict[str, Any]:
         """Get fabric-wide settings including fabric ID, infra VLAN, GIPO pool."""
@@ -144,18 +524,22 @@ class ACIClient:
         }
 
         try:
+            results = self._query_classes(
+                "infraSetPol", "infraProvAcc", "fabricSetupP", "fvFabricExtConnP"
+            )
+
             # Fabric settings from infraSetPol
-            infra_set = self._query_class("infraSetPol")
+            infra_set = results["infraSetPol"]
             if infra_set:
                 for pol in infra_set:
-                    if hasattr(pol, 'fabricId') and pol.fabricId:
+                    if getattr(pol, 'fabricId', None):
                         fabric_data['fabric_id'] = int(pol.fabricId)
 
             # Infra VLAN from infraProvAcc or infraCont
-            infra_vlan = self._query_class("infraProvAcc")
+            infra_vlan = results["infraProvAcc"]
             if infra_vlan:
                 for acc in infra_vlan:
-                    if hasattr(acc, 'vid') and acc.vid:
+                    if getattr(acc, 'vid', None):
                         fabric_data['infra_vlan_id'] = int(acc.vid)
                         break
             
@@ -164,33 +548,33 @@ class ACIClient:
                 infra_cont = self._query_class("infraCont")
                 if infra_cont:
                     for cont in infra_cont:
-                        if hasattr(cont, 'infraVlan') and cont.infraVlan:
+                        if getattr(cont, 'infraVlan', None):
                             fabric_data['infra_vlan_id'] = int(cont.infraVlan)
                             break
 
             # Get fabric name - try different approaches
             # First try fabricSetupP
-            setup_pol = self._query_class("fabricSetupP")
+            setup_pol = results["fabricSetupP"]
             if setup_pol:
                 for pol in setup_pol:
-                    if hasattr(pol, 'name') and pol.name:
+                    if getattr(pol, 'name', None):
                         fabric_data['name'] = str(pol.name)
                         break
             
             # Get GIPO pool from fvFabricExtConnP or similar
             # GIPO is used for external multicast routing
             try:
-                gipo_pol = self._query_class("fvFabricExtConnP")
+                gipo_pol = results["fvFabricExtConnP"]
                 if gipo_pol:
                     for pol in gipo_pol:
-                        if hasattr(pol, 'gipoPool') and pol.gipoPool:
+                        if getattr(pol, 'gipoPool', None):
                             fabric_data['gipo_pool'] = str(pol.gipoPool)
                             break
             except Exception as e:
-                logger.debug(f"Could not fetch GIPO pool: {e}")
+                logger.debug("Could not fetch GIPO pool: %s", e)
 
         except Exception as e:
-            logger.error(f"Error retrieving fabric settings: {e}")
+            logger.error("Error retrieving fabric settings: %s", e)
 
         return fabric_data
 
@@ -198,17 +582,20 @@ class ACIClient:
         """Get all fabric pods with TEP pool information."""
         pods = []
         try:
-            pod_objs = self._query_class("fabricPod")
-            for pod in pod_objs:
+            # fabricSetupP is only needed as a TEP pool fallback, but fetching
+            # it alongside the pods costs no extra latency
+            results = self._query_classes("fabricPod", "fabricSetupP")
+            for pod in results["fabricPod"]:
+                pod_id = getattr(pod, 'id', None)
                 pod_data = {
-                    'pod_id': int(pod.id) if hasattr(pod, 'id') else None,
-                    'name': f"pod-{pod.id}" if hasattr(pod, 'id') else None,
-                    'dn': str(pod.dn) if hasattr(pod, 'dn') else None,
+                    'pod_id': int(pod_id) if pod_id is not None else None,
+                    'name': f"pod-{pod_id}" if pod_id is not None else None,
+                    'dn': _str_or_none(pod, 'dn'),
                     'tep_pool': None,
                 }
                 
                 # Try to get TEP pool from the pod
-                if hasattr(pod, 'tepPool') and pod.tepPool:
+                if getattr(pod, 'tepPool', None):
                     pod_data['tep_pool'] = str(pod.tepPool)
                 
                 pods.append(pod_data)
@@ -216,20 +603,20 @@ class ACIClient:
             # If TEP pool not found on pod objects, try fabricSetupP
             if pods and not any(p.get('tep_pool') for p in pods):
                 try:
-                    setup_pol = self._query_class("fabricSetupP")
+                    setup_pol = results["fabricSetupP"]
                     if setup_pol:
                         for pol in setup_pol:
-                            if hasattr(pol, 'tepPool') and pol.tepPool:
+                            if getattr(pol, 'tepPool', None):
                                 # Apply to all pods (usually same TEP pool)
                                 for pod in pods:
                                     if not pod.get('tep_pool'):
                                         pod['tep_pool'] = str(pol.tepPool)
                                 break
                 except Exception as e:
-                    logger.debug(f"Could not fetch TEP pool from fabricSetupP: {e}")
+                    logger.debug("Could not fetch TEP pool from fabricSetupP: %s", e)
                     
         except Exception as e:
-            logger.error(f"Error retrieving fabric pods: {e}")
+            logger.error("Error retrieving fabric pods: %s", e)
         return pods
 
     def get_fabric_nodes(self) -> List[Dict[str, Any]]:
@@ -239,7 +626,7 @@ class ACIClient:
             node_objs = self._query_class("fabricNode")
             for node in node_objs:
                 # Extract pod_id from DN (topology/pod-1/node-101)
-                dn = str(node.dn) if hasattr(node, 'dn') else ''
+                dn = str(getattr(node, 'dn', ''))
                 pod_id = None
                 if 'pod-' in dn:
                     try:
@@ -249,21 +636,16 @@ class ACIClient:
                         pod_id = 1  # Default to pod 1
                 else:
                     pod_id = 1  # Default to pod 1
-                
+
+                node_id = getattr(node, 'id', None)
                 nodes.append({
-                    'node_id': int(node.id) if hasattr(node, 'id') else None,
-                    'name': str(node.name) if hasattr(node, 'name') else None,
-                    'serial': str(node.serial) if hasattr(node, 'serial') and node.serial else None,
-                    'model': str(node.model) if hasattr(node, 'model') and node.model else None,
-                    'role': str(node.role) if hasattr(node, 'role') else None,
+                    'node_id': int(node_id) if node_id is not None else None,
+                    **_parse_mo(node, _NODE_FIELDS),
                     'pod_id': pod_id,
-                    'fabric_st': str(node.fabricSt) if hasattr(node, 'fabricSt') else None,
-                    'address': str(node.address) if hasattr(node, 'address') else None,
-                    'version': str(node.version) if hasattr(node, 'version') else None,
                     'dn': dn,
                 })
         except Exception as e:
-            logger.error(f"Error retrieving fabric nodes: {e}")
+            logger.error("Error retrieving fabric nodes: %s", e)
         return nodes
 
     # Tenant Methods
@@ -271,16 +653,15 @@ class ACIClient:
         """Get all tenants with their attributes."""
         tenants = []
         try:
-            tenant_objs = self._query_class("fvTenant")
+            tenant_objs = self._query_tenant_class("fvTenant")
             for tn in tenant_objs:
                 tenants.append({
                     'name': str(tn.name),
                     'dn': str(tn.dn),
-                    'name_alias': str(tn.nameAlias) if hasattr(tn, 'nameAlias') and tn.nameAlias else None,
-                    'description': str(tn.descr) if hasattr(tn, 'descr') and tn.descr else None,
+                    **_parse_mo(tn, _NAMED_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving tenants: {e}")
+            logger.error("Error retrieving tenants: %s", e)
         return tenants
 
     # VRF Methods
@@ -288,28 +669,21 @@ class ACIClient:
         """Get all VRFs (Contexts) with their attributes."""
         vrfs = []
         try:
-            vrf_objs = self._query_class("fvCtx")
+            vrf_objs = self._query_tenant_class("fvCtx")
             for vrf in vrf_objs:
                 # Extract tenant name from DN
-                dn_parts = str(vrf.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
+                dn = str(vrf.dn)
+                tenant_name = _tenant_from_dn(dn)
 
                 vrfs.append({
                     'name': str(vrf.name),
-                    'dn': str(vrf.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
-                    'name_alias': str(vrf.nameAlias) if hasattr(vrf, 'nameAlias') and vrf.nameAlias else None,
-                    'description': str(vrf.descr) if hasattr(vrf, 'descr') and vrf.descr else None,
-                    'bd_enforced_enabled': str(vrf.bdEnforcedEnable) == 'yes' if hasattr(vrf, 'bdEnforcedEnable') else False,
-                    'ip_data_plane_learning': str(vrf.ipDataPlaneLearning) if hasattr(vrf, 'ipDataPlaneLearning') else 'enabled',
-                    'pc_enf_dir': str(vrf.pcEnfDir) if hasattr(vrf, 'pcEnfDir') else 'ingress',
-                    'pc_enf_pref': str(vrf.pcEnfPref) if hasattr(vrf, 'pcEnfPref') else 'enforced',
-                    'pim_v4_enabled': str(vrf.knwMcastAct) == 'permit' if hasattr(vrf, 'knwMcastAct') else False,
+                    **_parse_mo(vrf, _VRF_FIELDS),
                     'pim_v6_enabled': False,  # Requires additional query
-                    'preferred_group': str(vrf.vrfPref) == 'enabled' if hasattr(vrf, 'vrfPref') else False,
                 })
         except Exception as e:
-            logger.error(f"Error retrieving VRFs: {e}")
+            logger.error("Error retrieving VRFs: %s", e)
         return vrfs
 
     # Bridge Domain Methods
@@ -317,52 +691,36 @@ class ACIClient:
         """Get all Bridge Domains with their attributes."""
         bds = []
         try:
-            bd_objs = self._query_class("fvBD", subtree="children")
+            # Fetches the object and relation classes concurrently if the
+            # orchestrator has not prefetched them
+            self.prefetch("get_bridge_domains")
+            bd_objs = self._query_tenant_class("fvBD")
+            rs_ctx_by_bd = self._relations_by_parent("fvRsCtx")
             for bd in bd_objs:
                 # Extract tenant and VRF from DN
-                dn_parts = str(bd.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
+                dn = str(bd.dn)
+                tenant_name = _tenant_from_dn(dn)
 
                 # Get associated VRF - extract both VRF name and its tenant
                 vrf_name = None
                 vrf_tenant = None
-                if hasattr(bd, 'children'):
-                    for child in bd.children:
-                        if child.__class__.__name__ == 'RsCtx':
-                            vrf_dn = str(child.tDn) if hasattr(child, 'tDn') else None
-                            if vrf_dn:
-                                # Parse DN like "uni/tn-common/ctx-default"
-                                vrf_dn_parts = vrf_dn.split('/')
-                                for part in vrf_dn_parts:
-                                    if part.startswith('tn-'):
-                                        vrf_tenant = part.replace('tn-', '')
-                                    elif part.startswith('ctx-'):
-                                        vrf_name = part.replace('ctx-', '')
+                vrf_dn = _str_or_none(rs_ctx_by_bd.get(dn), 'tDn')
+                if vrf_dn:
+                    # Parse DN like "uni/tn-common/ctx-default"
+                    vrf_fields = _parse_dn(vrf_dn)
+                    vrf_tenant = vrf_fields.get('tn')
+                    vrf_name = vrf_fields.get('ctx')
 
                 bds.append({
                     'name': str(bd.name),
-                    'dn': str(bd.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
                     'vrf': vrf_name,
                     'vrf_tenant': vrf_tenant,  # The tenant where the VRF actually lives
-                    'name_alias': str(bd.nameAlias) if hasattr(bd, 'nameAlias') and bd.nameAlias else None,
-                    'description': str(bd.descr) if hasattr(bd, 'descr') and bd.descr else None,
-                    'arp_flood': str(bd.arpFlood) == 'yes' if hasattr(bd, 'arpFlood') else False,
-                    'ep_move_detect': str(bd.epMoveDetectMode) if hasattr(bd, 'epMoveDetectMode') else None,
-                    'ip_learning': str(bd.ipLearning) == 'yes' if hasattr(bd, 'ipLearning') else True,
-                    'limit_ip_learn': str(bd.limitIpLearnToSubnets) == 'yes' if hasattr(bd, 'limitIpLearnToSubnets') else True,
-                    'mac': str(bd.mac) if hasattr(bd, 'mac') else '00:22:BD:F8:19:FF',
-                    'multi_dest_pkt_act': str(bd.multiDstPktAct) if hasattr(bd, 'multiDstPktAct') else 'bd-flood',
-                    'unicast_route': str(bd.unicastRoute) == 'yes' if hasattr(bd, 'unicastRoute') else True,
-                    'unk_mac_ucast_act': str(bd.unkMacUcastAct) if hasattr(bd, 'unkMacUcastAct') else 'proxy',
-                    'unk_mcast_act': str(bd.unkMcastAct) if hasattr(bd, 'unkMcastAct') else 'flood',
-                    'v6_unk_mcast_act': str(bd.v6unkMcastAct) if hasattr(bd, 'v6unkMcastAct') else 'flood',
-                    'vmac': str(bd.vmac) if hasattr(bd, 'vmac') and bd.vmac else None,
-                    'pim_v4_enabled': str(bd.mcastAllow) == 'yes' if hasattr(bd, 'mcastAllow') else False,
-                    'host_route_adv': str(bd.hostBasedRouting) == 'yes' if hasattr(bd, 'hostBasedRouting') else False,
+                    **_parse_mo(bd, _BD_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving Bridge Domains: {e}")
+            logger.error("Error retrieving Bridge Domains: %s", e)
         return bds
 
     # Subnet Methods
@@ -370,32 +728,23 @@ class ACIClient:
         """Get all Bridge Domain Subnets."""
         subnets = []
         try:
-            subnet_objs = self._query_class("fvSubnet")
+            subnet_objs = self._query_tenant_class("fvSubnet")
             for subnet in subnet_objs:
                 # Extract BD and tenant from DN
-                dn_parts = str(subnet.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
-                bd_name = None
-                for part in dn_parts:
-                    if part.startswith('BD-'):
-                        bd_name = part.replace('BD-', '')
-                        break
+                dn = str(subnet.dn)
+                dn_fields = _parse_dn(dn)
+                tenant_name = dn_fields.get('tn')
+                bd_name = dn_fields.get('bd')
 
                 subnets.append({
                     'ip': str(subnet.ip),
-                    'dn': str(subnet.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
                     'bridge_domain': bd_name,
-                    'name': str(subnet.name) if hasattr(subnet, 'name') and subnet.name else None,
-                    'name_alias': str(subnet.nameAlias) if hasattr(subnet, 'nameAlias') and subnet.nameAlias else None,
-                    'description': str(subnet.descr) if hasattr(subnet, 'descr') and subnet.descr else None,
-                    'preferred': str(subnet.preferred) == 'yes' if hasattr(subnet, 'preferred') else False,
-                    'scope': str(subnet.scope) if hasattr(subnet, 'scope') else 'private',
-                    'virtual': str(subnet.virtual) == 'yes' if hasattr(subnet, 'virtual') else False,
-                    'ctrl': str(subnet.ctrl) if hasattr(subnet, 'ctrl') else None,
+                    **_parse_mo(subnet, _SUBNET_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving Subnets: {e}")
+            logger.error("Error retrieving Subnets: %s", e)
         return subnets
 
     # Application Profile Methods
@@ -403,21 +752,20 @@ class ACIClient:
         """Get all Application Profiles."""
         aps = []
         try:
-            ap_objs = self._query_class("fvAp")
+            ap_objs = self._query_tenant_class("fvAp")
             for ap in ap_objs:
                 # Extract tenant from DN
-                dn_parts = str(ap.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
+                dn = str(ap.dn)
+                tenant_name = _tenant_from_dn(dn)
 
                 aps.append({
                     'name': str(ap.name),
-                    'dn': str(ap.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
-                    'name_alias': str(ap.nameAlias) if hasattr(ap, 'nameAlias') and ap.nameAlias else None,
-                    'description': str(ap.descr) if hasattr(ap, 'descr') and ap.descr else None,
+                    **_parse_mo(ap, _NAMED_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving Application Profiles: {e}")
+            logger.error("Error retrieving Application Profiles: %s", e)
         return aps
 
     # EPG Methods
@@ -425,41 +773,29 @@ class ACIClient:
         """Get all Endpoint Groups with their attributes."""
         epgs = []
         try:
-            epg_objs = self._query_class("fvAEPg", subtree="children")
+            self.prefetch("get_epgs")
+            epg_objs = self._query_tenant_class("fvAEPg")
+            rs_bd_by_epg = self._relations_by_parent("fvRsBd")
             for epg in epg_objs:
                 # Extract tenant and AP from DN
-                dn_parts = str(epg.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
-                ap_name = None
-                for part in dn_parts:
-                    if part.startswith('ap-'):
-                        ap_name = part.replace('ap-', '')
-                        break
+                dn = str(epg.dn)
+                dn_fields = _parse_dn(dn)
+                tenant_name = dn_fields.get('tn')
+                ap_name = dn_fields.get('ap')
 
                 # Get associated BD
-                bd_name = None
-                if hasattr(epg, 'children'):
-                    for child in epg.children:
-                        if child.__class__.__name__ == 'RsBd':
-                            bd_name = str(child.tnFvBDName) if hasattr(child, 'tnFvBDName') else None
+                bd_name = _str_or_none(rs_bd_by_epg.get(dn), 'tnFvBDName')
 
                 epgs.append({
                     'name': str(epg.name),
-                    'dn': str(epg.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
                     'app_profile': ap_name,
                     'bridge_domain': bd_name,
-                    'name_alias': str(epg.nameAlias) if hasattr(epg, 'nameAlias') and epg.nameAlias else None,
-                    'description': str(epg.descr) if hasattr(epg, 'descr') and epg.descr else None,
-                    'pref_gr_memb': str(epg.prefGrMemb) if hasattr(epg, 'prefGrMemb') else 'exclude',
-                    'prio': str(epg.prio) if hasattr(epg, 'prio') else 'unspecified',
-                    'pc_enf_pref': str(epg.pcEnfPref) if hasattr(epg, 'pcEnfPref') else 'unenforced',
-                    'flood_on_encap': str(epg.floodOnEncap) == 'enabled' if hasattr(epg, 'floodOnEncap') else False,
-                    'is_attr_based_epg': str(epg.isAttrBasedEPg) == 'yes' if hasattr(epg, 'isAttrBasedEPg') else False,
-                    'shutdown': str(epg.shutdown) == 'yes' if hasattr(epg, 'shutdown') else False,
+                    **_parse_mo(epg, _EPG_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving EPGs: {e}")
+            logger.error("Error retrieving EPGs: %s", e)
         return epgs
 
     # ESG Methods
@@ -467,40 +803,32 @@ class ACIClient:
         """Get all Endpoint Security Groups."""
         esgs = []
         try:
-            esg_objs = self._query_class("fvESg", subtree="children")
+            self.prefetch("get_esgs")
+            esg_objs = self._query_tenant_class("fvESg")
+            rs_scope_by_esg = self._relations_by_parent("fvRsScope")
             for esg in esg_objs:
                 # Extract tenant and AP from DN
-                dn_parts = str(esg.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
-                ap_name = None
-                for part in dn_parts:
-                    if part.startswith('ap-'):
-                        ap_name = part.replace('ap-', '')
-                        break
+                dn = str(esg.dn)
+                dn_fields = _parse_dn(dn)
+                tenant_name = dn_fields.get('tn')
+                ap_name = dn_fields.get('ap')
 
                 # Get associated VRF
                 vrf_name = None
-                if hasattr(esg, 'children'):
-                    for child in esg.children:
-                        if child.__class__.__name__ == 'RsScope':
-                            vrf_dn = str(child.tDn) if hasattr(child, 'tDn') else None
-                            if vrf_dn:
-                                vrf_name = vrf_dn.split('/')[-1].replace('ctx-', '')
+                vrf_dn = _str_or_none(rs_scope_by_esg.get(dn), 'tDn')
+                if vrf_dn:
+                    vrf_name = vrf_dn.split('/')[-1].replace('ctx-', '')
 
                 esgs.append({
                     'name': str(esg.name),
-                    'dn': str(esg.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
                     'app_profile': ap_name,
                     'vrf': vrf_name,
-                    'name_alias': str(esg.nameAlias) if hasattr(esg, 'nameAlias') and esg.nameAlias else None,
-                    'description': str(esg.descr) if hasattr(esg, 'descr') and esg.descr else None,
-                    'pref_gr_memb': str(esg.prefGrMemb) if hasattr(esg, 'prefGrMemb') else 'exclude',
-                    'prio': str(esg.prio) if hasattr(esg, 'prio') else 'unspecified',
-                    'shutdown': str(esg.shutdown) == 'yes' if hasattr(esg, 'shutdown') else False,
+                    **_parse_mo(esg, _ESG_FIELDS),
                 })
         except Exception as e:
-            logger.error(f"Error retrieving ESGs: {e}")
+            logger.error("Error retrieving ESGs: %s", e)
         return esgs
 
     # Contract Methods
@@ -508,35 +836,27 @@ class ACIClient:
         """Get all Contracts with subjects and filters."""
         contracts = []
         try:
-            contract_objs = self._query_class("vzBrCP", subtree="children")
+            contract_objs = self._query_tenant_class("vzBrCP")
             for contract in contract_objs:
                 # Extract tenant from DN
-                dn_parts = str(contract.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
+                dn = str(contract.dn)
+                tenant_name = _tenant_from_dn(dn)
 
                 # Get subjects
-                subjects = []
-                if hasattr(contract, 'children'):
-                    for child in contract.children:
-                        if child.__class__.__name__ == 'Subj':
-                            subjects.append({
-                                'name': str(child.name),
-                                'description': str(child.descr) if hasattr(child, 'descr') and child.descr else None,
-                            })
+                subjects = [
+                    {'name': str(subj.name), 'description': _str_or_none(subj, 'descr')}
+                    for subj in _children_of(contract, 'Subj')
+                ]
 
                 contracts.append({
                     'name': str(contract.name),
-                    'dn': str(contract.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
-                    'name_alias': str(contract.nameAlias) if hasattr(contract, 'nameAlias') and contract.nameAlias else None,
-                    'description': str(contract.descr) if hasattr(contract, 'descr') and contract.descr else None,
-                    'scope': str(contract.scope) if hasattr(contract, 'scope') else 'context',
-                    'prio': str(contract.prio) if hasattr(contract, 'prio') else 'unspecified',
-                    'target_dscp': str(contract.targetDscp) if hasattr(contract, 'targetDscp') else 'unspecified',
+                    **_parse_mo(contract, _CONTRACT_FIELDS),
                     'subjects': subjects,
                 })
         except Exception as e:
-            logger.error(f"Error retrieving Contracts: {e}")
+            logger.error("Error retrieving Contracts: %s", e)
         return contracts
 
     def get_contract_relationships(self) -> Dict[str, Any]:
@@ -545,167 +865,61 @@ class ACIClient:
             'providers': [],  # List of {contract, epg/vzany, tenant, ap}
             'consumers': [],
         }
+        # Checked once, so production runs skip the per-relation debug call
+        log_vzany = logger.isEnabledFor(logging.DEBUG)
         try:
-            # Get EPG contract providers (fvRsProv)
-            prov_objs = self._query_class("fvRsProv")
-            for prov in prov_objs:
-                dn = str(prov.dn)
-                # DN format: uni/tn-{tenant}/ap-{ap}/epg-{epg}/rsprov-{contract}
-                dn_parts = dn.split('/')
-                tenant_name = None
-                ap_name = None
-                epg_name = None
-                
-                for part in dn_parts:
-                    if part.startswith('tn-'):
-                        tenant_name = part[3:]
-                    elif part.startswith('ap-'):
-                        ap_name = part[3:]
-                    elif part.startswith('epg-'):
-                        epg_name = part[4:]
-                
-                contract_name = str(prov.tnVzBrCPName) if hasattr(prov, 'tnVzBrCPName') else None
-                
-                if contract_name and epg_name:
-                    relationships['providers'].append({
+            self.prefetch("get_contract_relationships")
+            for class_name, bucket, is_vzany in _CONTRACT_RELATIONS:
+                append = relationships[bucket].append
+                for rel in self._query_tenant_class(class_name):
+                    # DN format: uni/tn-{tenant}/ap-{ap}/epg-{epg}/rsprov-{contract}
+                    #        or: uni/tn-{tenant}/ctx-{vrf}/any/rsanyToProv-{contract}
+                    dn_fields = _parse_dn(str(rel.dn))
+                    owner = dn_fields.get('ctx' if is_vzany else 'epg')
+                    contract_name = _str_or_none(rel, 'tnVzBrCPName')
+                    if not (contract_name and owner):
+                        continue
+
+                    append({
                         'contract': contract_name,
-                        'tenant': tenant_name,
-                        'ap': ap_name,
-                        'epg': epg_name,
-                        'vrf': None,
-                        'is_vzany': False,
+                        'tenant': dn_fields.get('tn'),
+                        'ap': None if is_vzany else dn_fields.get('ap'),
+                        'epg': None if is_vzany else owner,
+                        'vrf': owner if is_vzany else None,
+                        'is_vzany': is_vzany,
                     })
-
-            # Get EPG contract consumers (fvRsCons)
-            cons_objs = self._query_class("fvRsCons")
-            for cons in cons_objs:
-                dn = str(cons.dn)
-                dn_parts = dn.split('/')
-                tenant_name = None
-                ap_name = None
-                epg_name = None
-                
-                for part in dn_parts:
-                    if part.startswith('tn-'):
-                        tenant_name = part[3:]
-                    elif part.startswith('ap-'):
-                        ap_name = part[3:]
-                    elif part.startswith('epg-'):
-                        epg_name = part[4:]
-                
-                contract_name = str(cons.tnVzBrCPName) if hasattr(cons, 'tnVzBrCPName') else None
-                
-                if contract_name and epg_name:
-                    relationships['consumers'].append({
-                        'contract': contract_name,
-                        'tenant': tenant_name,
-                        'ap': ap_name,
-                        'epg': epg_name,
-                        'vrf': None,
-                        'is_vzany': False,
-                    })
-
-            # Get vzAny contract providers (vzRsAnyToProv)
-            try:
-                vzany_prov_objs = self._query_class("vzRsAnyToProv")
-                for prov in vzany_prov_objs:
-                    dn = str(prov.dn)
-                    # DN format: uni/tn-{tenant}/ctx-{vrf}/any/rsanyToProv-{contract}
-                    dn_parts = dn.split('/')
-                    tenant_name = None
-                    vrf_name = None
-                    
-                    for part in dn_parts:
-                        if part.startswith('tn-'):
-                            tenant_name = part[3:]
-                        elif part.startswith('ctx-'):
-                            vrf_name = part[4:]
-                    
-                    contract_name = str(prov.tnVzBrCPName) if hasattr(prov, 'tnVzBrCPName') else None
-                    
-                    if contract_name and vrf_name:
-                        relationships['providers'].append({
-                            'contract': contract_name,
-                            'tenant': tenant_name,
-                            'ap': None,
-                            'epg': None,
-                            'vrf': vrf_name,
-                            'is_vzany': True,
-                        })
-                        logger.debug(f"Found vzAny provider: VRF {vrf_name} -> {contract_name}")
-            except Exception as e:
-                logger.debug(f"Could not query vzRsAnyToProv: {e}")
-
-            # Get vzAny contract consumers (vzRsAnyToCons)
-            try:
-                vzany_cons_objs = self._query_class("vzRsAnyToCons")
-                for cons in vzany_cons_objs:
-                    dn = str(cons.dn)
-                    # DN format: uni/tn-{tenant}/ctx-{vrf}/any/rsanyToCons-{contract}
-                    dn_parts = dn.split('/')
-                    tenant_name = None
-                    vrf_name = None
-                    
-                    for part in dn_parts:
-                        if part.startswith('tn-'):
-                            tenant_name = part[3:]
-                        elif part.startswith('ctx-'):
-                            vrf_name = part[4:]
-                    
-                    contract_name = str(cons.tnVzBrCPName) if hasattr(cons, 'tnVzBrCPName') else None
-                    
-                    if contract_name and vrf_name:
-                        relationships['consumers'].append({
-                            'contract': contract_name,
-                            'tenant': tenant_name,
-                            'ap': None,
-                            'epg': None,
-                            'vrf': vrf_name,
-                            'is_vzany': True,
-                        })
-                        logger.debug(f"Found vzAny consumer: VRF {vrf_name} -> {contract_name}")
-            except Exception as e:
-                logger.debug(f"Could not query vzRsAnyToCons: {e}")
+                    if is_vzany and log_vzany:
+                        logger.debug("Found vzAny %s: VRF %s -> %s", bucket[:-1], owner, contract_name)
 
         except Exception as e:
-            logger.error(f"Error retrieving contract relationships: {e}")
+            logger.error("Error retrieving contract relationships: %s", e)
         return relationships
 
     def get_contract_filters(self) -> List[Dict[str, Any]]:
         """Get all Contract Filters with entries."""
         filters = []
         try:
-            filter_objs = self._query_class("vzFilter", subtree="children")
+            filter_objs = self._query_tenant_class("vzFilter")
             for flt in filter_objs:
                 # Extract tenant from DN
-                dn_parts = str(flt.dn).split('/')
-                tenant_name = dn_parts[1].replace('tn-', '') if len(dn_parts) > 1 else None
+                dn = str(flt.dn)
+                tenant_name = _tenant_from_dn(dn)
 
                 # Get filter entries
-                entries = []
-                if hasattr(flt, 'children'):
-                    for child in flt.children:
-                        if child.__class__.__name__ == 'Entry':
-                            entries.append({
-                                'name': str(child.name),
-                                'etherT': str(child.etherT) if hasattr(child, 'etherT') else 'unspecified',
-                                'prot': str(child.prot) if hasattr(child, 'prot') else 'unspecified',
-                                'dFromPort': str(child.dFromPort) if hasattr(child, 'dFromPort') else 'unspecified',
-                                'dToPort': str(child.dToPort) if hasattr(child, 'dToPort') else 'unspecified',
-                                'sFromPort': str(child.sFromPort) if hasattr(child, 'sFromPort') else 'unspecified',
-                                'sToPort': str(child.sToPort) if hasattr(child, 'sToPort') else 'unspecified',
-                            })
+                entries = [
+                    {'name': str(entry.name), **_parse_mo(entry, _FILTER_ENTRY_FIELDS)}
+                    for entry in _children_of(flt, 'Entry')
+                ]
 
                 filters.append({
                     'name': str(flt.name),
-                    'dn': str(flt.dn),
+                    'dn': dn,
                     'tenant': tenant_name,
-                    'name_alias': str(flt.nameAlias) if hasattr(flt, 'nameAlias') and flt.nameAlias else None,
-                    'description': str(flt.descr) if hasattr(flt, 'descr') and flt.descr else None,
+                    **_parse_mo(flt, _NAMED_FIELDS),
                     'entries': entries,
                 })
         except Exception as e:
-            logger.error(f"Error retrieving Contract Filters: {e}")
+            logger.error("Error retrieving Contract Filters: %s", e)
         return filters
 
     # =========================================================================
@@ -745,192 +959,77 @@ class ACIClient:
         """
         firmware_map: Dict[str, Dict[str, Any]] = {}
 
-        # --- 1. Query firmwareRunning (switch nodes) ---
-        try:
-            running_objs = self._query_class("firmwareRunning")
-            for fw in running_objs:
-                version = str(fw.version) if hasattr(fw, 'version') and fw.version else None
-                if not version:
-                    continue
-
-                entry = firmware_map.setdefault(version, {
-                    'version': version,
-                    'filename': None,
-                    'checksum': None,
-                    'type': 'switch',
-                    'internal_label': None,
-                    'node_dn': None,
-                })
-
-                # Extract whatever attributes are available
-                for attr in ['fwName', 'fileName', 'fullVersion']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            entry['filename'] = val
-                            break
-
-                for attr in ['checksum', 'md5sum', 'md5']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            entry['checksum'] = val
-                            break
-
-                if hasattr(fw, 'internalLabel') and fw.internalLabel:
-                    entry['internal_label'] = str(fw.internalLabel)
-
-                if hasattr(fw, 'dn'):
-                    entry['node_dn'] = str(fw.dn)
-
-                entry['type'] = 'switch'
-
-            logger.debug(f"firmwareRunning: found {len(running_objs)} entries")
-        except Exception as e:
-            logger.debug(f"Could not query firmwareRunning: {e}")
-
-        # --- 2. Query firmwareCtrlrRunning (APIC controllers) ---
-        try:
-            ctrl_objs = self._query_class("firmwareCtrlrRunning")
-            for fw in ctrl_objs:
-                version = str(fw.version) if hasattr(fw, 'version') and fw.version else None
-                if not version:
-                    continue
-
-                entry = firmware_map.setdefault(version, {
-                    'version': version,
-                    'filename': None,
-                    'checksum': None,
-                    'type': 'controller',
-                    'internal_label': None,
-                    'node_dn': None,
-                })
-
-                # Controller entries often have internalLabel (SHA1 build hash)
-                if hasattr(fw, 'internalLabel') and fw.internalLabel:
-                    entry['internal_label'] = str(fw.internalLabel)
-
-                for attr in ['fwName', 'fileName', 'fullVersion']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            entry['filename'] = val
-                            break
-
-                for attr in ['checksum', 'md5sum', 'md5']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            entry['checksum'] = val
-                            break
-
-                if hasattr(fw, 'dn'):
-                    entry['node_dn'] = str(fw.dn)
-
-                # Only set type if not already set by switch
-                if entry['type'] == 'unknown':
-                    entry['type'] = 'controller'
-
-            logger.debug(f"firmwareCtrlrRunning: found {len(ctrl_objs)} entries")
-        except Exception as e:
-            logger.debug(f"Could not query firmwareCtrlrRunning: {e}")
-
-        # --- 3. Query firmwareFirmware (staged images in APIC repo) ---
-        # This is the most likely source of filenames and checksums on
-        # real fabrics where firmware has been downloaded to the APIC.
-        try:
-            repo_objs = self._query_class("firmwareFirmware")
-            for fw in repo_objs:
-                version = None
-                filename = None
-                checksum = None
-
-                # Try to extract version
-                for attr in ['version', 'fwVersion', 'name']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            version = val
-                            break
-
-                # Try to extract filename
-                for attr in ['fileName', 'fwName', 'name', 'fullName']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none') and ('.' in val or 'aci' in val.lower()):
-                            filename = val
-                            break
-
-                # Try to extract checksum
-                for attr in ['checksum', 'md5sum', 'md5', 'digest']:
-                    if hasattr(fw, attr):
-                        val = str(getattr(fw, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            checksum = val
-                            break
-
-                if version and version in firmware_map:
-                    # Enrich existing entry from running firmware
-                    if filename:
-                        firmware_map[version]['filename'] = filename
-                    if checksum:
-                        firmware_map[version]['checksum'] = checksum
-                elif version:
-                    # New version only in repo (not currently running)
-                    firmware_map[version] = {
-                        'version': version,
-                        'filename': filename,
-                        'checksum': checksum,
-                        'type': 'staged',
-                        'internal_label': None,
-                        'node_dn': None,
-                    }
-
-            logger.debug(f"firmwareFirmware: found {len(repo_objs)} entries")
-        except Exception as e:
-            logger.debug(f"Could not query firmwareFirmware: {e}")
-
-        # --- 4. Query firmwareCompRunning for additional component details ---
-        # This can have BIOS/CIMC versions with more detail
-        try:
-            comp_objs = self._query_class("firmwareCompRunning")
-            for fw in comp_objs:
-                version = str(fw.version) if hasattr(fw, 'version') and fw.version else None
-                if not version or version not in firmware_map:
-                    continue
-
-                # Only fill in missing data
-                entry = firmware_map[version]
-                if not entry.get('checksum'):
-                    for attr in ['checksum', 'md5sum', 'md5']:
-                        if hasattr(fw, attr):
-                            val = str(getattr(fw, attr))
-                            if val and val not in ('', 'None', 'none'):
-                                entry['checksum'] = val
-                                break
-
-            logger.debug(f"firmwareCompRunning: found {len(comp_objs)} entries")
-        except Exception as e:
-            logger.debug(f"Could not query firmwareCompRunning: {e}")
-
-        # --- 5. Try firmwareOSource for download source info ---
-        try:
-            src_objs = self._query_class("firmwareOSource")
-            for src in src_objs:
-                # May contain URL/path to firmware image
-                for attr in ['url', 'source', 'path']:
-                    if hasattr(src, attr):
-                        val = str(getattr(src, attr))
-                        if val and val not in ('', 'None', 'none'):
-                            logger.debug(f"firmwareOSource {attr}: {val}")
-            logger.debug(f"firmwareOSource: found {len(src_objs)} entries")
-        except Exception as e:
-            logger.debug(f"Could not query firmwareOSource: {e}")
+        # The classes are independent, so fetch them concurrently and merge
+        # them below in table order. firmwareOSource is only ever logged, so
+        # it is not fetched at all unless debug logging is on.
+        class_names = [source[0] for source in _FIRMWARE_SOURCES]
+        log_sources = logger.isEnabledFor(logging.DEBUG)
+        if log_sources:
+            class_names.append("firmwareOSource")
+        results = self._query_classes(*class_names)
+
+        for (class_name, new_type, version_attrs, filename_attrs, filename_ok,
+             checksum_attrs, on_node) in _FIRMWARE_SOURCES:
+            try:
+                fw_objs = results[class_name]
+                for fw in fw_objs:
+                    version = _first_attr(fw, version_attrs)
+                    if not version:
+                        continue
+
+                    entry = firmware_map.get(version)
+                    if entry is None:
+                        if new_type is None:
+                            continue
+                        entry = firmware_map[version] = _new_firmware_entry(version, new_type)
+
+                    # Sources without a type of their own only fill in gaps
+                    filename = _first_attr(fw, filename_attrs, accept=filename_ok)
+                    if filename and (new_type or not entry['filename']):
+                        entry['filename'] = filename
+
+                    checksum = _first_attr(fw, checksum_attrs)
+                    if checksum and (new_type or not entry['checksum']):
+                        entry['checksum'] = checksum
+
+                    if on_node:
+                        internal_label = _str_or_none(fw, 'internalLabel')
+                        if internal_label:
+                            entry['internal_label'] = internal_label
+                        node_dn = _str_or_none(fw, 'dn')
+                        if node_dn:
+                            entry['node_dn'] = node_dn
+
+                logger.debug("%s: found %d entries", class_name, len(fw_objs))
+            except Exception as e:
+                logger.debug("Could not read %s: %s", class_name, e)
 
-        logger.info(
-            f"Firmware details: found metadata for {len(firmware_map)} version(s), "
-            f"{sum(1 for v in firmware_map.values() if v.get('filename'))} with filename, "
-            f"{sum(1 for v in firmware_map.values() if v.get('checksum'))} with checksum"
-        )
+        # firmwareOSource may carry the download source of the images
+        if log_sources:
+            try:
+                src_objs = results["firmwareOSource"]
+                for src in src_objs:
+                    # May contain URL/path to firmware image
+                    for attr in _SOURCE_ATTRS:
+                        val = str(getattr(src, attr, None))
+                        if val not in _EMPTY_VALUES:
+                            logger.debug("firmwareOSource %s: %s", attr, val)
+                logger.debug("firmwareOSource: found %d entries", len(src_objs))
+            except Exception as e:
+                logger.debug("Could not query firmwareOSource: %s", e)
+
+        # The counts below walk every version, so only compute them if logged
+        if logger.isEnabledFor(logging.INFO):
+            with_filename = with_checksum = 0
+            for entry in firmware_map.values():
+                if entry['filename']:
+                    with_filename += 1
+                if entry['checksum']:
+                    with_checksum += 1
+            logger.info(
+                "Firmware details: found metadata for %d version(s), "
+                "%d with filename, %d with checksum",
+                len(firmware_map), with_filename, with_checksum,
+            )
 
         return firmware_map
\ No newline at end of file
@@ -5,9 +5,8 @@ Includes support for the netbox-software-tracker plugin for firmware version tra
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from functools import lru_cache
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +17,19 @@ except ImportError:
     PYNETBOX_AVAILABLE = False
     logger.warning("pynetbox not installed. Install with: pip install pynetbox")
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class NetBoxClient:
     """
@@ -26,13 +38,17 @@ class NetBoxClient:
     Includes integration with netbox-software-tracker plugin.
     """
 
-    def __init__(self, url: str, token: str, verify_ssl: bool = True, timeout: int = 30):
+    def __init__(self, url: str, token: str, verify_ssl: bool = True, timeout: int = 30,
+                 pool_size: int = 32):
         self.url = url.rstrip('/')
         self.token = token
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.pool_size = pool_size
         self._api: Optional[pynetbox.api] = None
+        self._session = None
         self._connected = False
+        self._contract_relations_cache: Optional[set] = None
 
     def connect(self) -> bool:
         """Establish connection to NetBox."""
@@ -45,22 +61,44 @@ class NetBoxClient:
                 self.url,
                 token=self.token,
             )
-            if not self.verify_ssl:
-                import requests
-                session = requests.Session()
-                session.verify = False
-                self._api.http_session = session
+            self._api.http_session = self.session
 
             # Test connection
             self._api.status()
             self._connected = True
-            logger.info(f"Connected to NetBox at {self.url}")
+            logger.info("Connected to NetBox at %s", self.url)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to NetBox: {e}")
+            logger.error("Failed to connect to NetBox: %s", e)
             self._connected = False
             return False
 
+    @property
+    def session(self):
+        """
+        Shared HTTP session used by pynetbox and all raw plugin requests.
+
+        Connections are pooled and kept alive, and transient connection
+        failures are retried with backoff.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.verify = self.verify_ssl
+            session.headers.update({
+                "Authorization": f"Token {self.token}",
+                "Accept": "application/json",
+                "Connection": "keep-alive",
+            })
+            self._session = session
+        return self._session
+
     @property
     def api(self) -> pynetbox.api:
         """Get pynetbox API instance."""
@@ -90,21 +128,19 @@ class NetBoxClient:
             new_obj = endpoint.create(create_params)
             return new_obj, True
         except Exception as e:
-            logger.error(f"Error in get_or_create: {e}")
+            logger.error("Error in get_or_create: %s", e)
             raise
 
-    def _update_if_changed(self, obj: Any, updates: Dict, 
-                           verify: bool = True) -> Tuple[bool, bool]:
-        """
-        Update object if any attributes have changed.
-        Returns (changed, verified).
-        """
+    def diff_updates(self, obj: Any, updates: Dict) -> Dict:
+        """Return the subset of updates that differ from the object's current values."""
         changes = {}
         for key, value in updates.items():
             current_value = getattr(obj, key, None)
-            # Handle nested objects (like foreign keys)
+            # Handle nested objects (like foreign keys) and choice fields
             if hasattr(current_value, 'id'):
                 current_value = current_value.id
+            elif hasattr(current_value, 'value'):
+                current_value = current_value.value
             if hasattr(value, 'id'):
                 value = value.id
             
@@ -120,39 +156,48 @@ class NetBoxClient:
             
             if current_str != new_str:
                 changes[key] = value
+        return changes
+
+    def changes_applied(self, obj: Any, changes: Dict) -> bool:
+        """Check that an object reflects the given changes."""
+        for key, expected in changes.items():
+            actual = getattr(obj, key, None)
+            if hasattr(actual, 'id'):
+                actual = actual.id
+            elif hasattr(actual, 'value'):
+                actual = actual.value
+            actual_str = str(actual) if actual is not None else ''
+            expected_str = str(expected) if expected is not None else ''
+            if actual_str != expected_str:
+                logger.warning(
+                    "Verification failed for %s: expected %s, got %s",
+                    key, expected, actual
+                )
+                return False
+        return True
 
+    def _update_if_changed(self, obj: Any, updates: Dict, 
+                           verify: bool = True) -> Tuple[bool, bool]:
+        """
+        Update object if any attributes have changed.
+        Returns (changed, verified).
+        """
+        changes = self.diff_updates(obj, updates)
         if not changes:
             return False, True
 
         try:
             obj.update(changes)
-            
-            if verify:
-                time.sleep(0.1)
-                try:
-                    if hasattr(obj, 'full_details'):
-                        obj.full_details()
-                    elif hasattr(obj, 'refresh'):
-                        obj.refresh()
-                except Exception as refresh_err:
-                    logger.debug(f"Could not refresh object for verification: {refresh_err}")
-                    return True, False
-                    
-                for key, expected in changes.items():
-                    actual = getattr(obj, key, None)
-                    if hasattr(actual, 'id'):
-                        actual = actual.id
-                    actual_str = str(actual) if actual is not None else ''
-                    expected_str = str(expected) if expected is not None else ''
-                    if actual_str != expected_str:
-                        logger.warning(f"Verification failed for {key}: expected {expected}, got {actual}")
-                        return True, False
-                return True, True
-            return True, True
         except Exception as e:
-            logger.error(f"Error updating object: {e}")
+            logger.error("Error updating object: %s", e)
             return False, False
 
+        # update() parses the PATCH response back into the object (pynetbox
+        # >= 7.7.0), so the write can be verified without a second GET
+        if verify:
+            return True, self.changes_applied(obj, changes)
+        return True, True
+
     # Fabric Operations
     def get_or_create_fabric(self, name: str, fabric_id: int = 1, **kwargs) -> Tuple[Any, bool]:
         """Get or create an ACI Fabric."""
@@ -167,7 +212,7 @@ class NetBoxClient:
             new_obj = self.aci_plugin.fabrics.create(create_params)
             return new_obj, True
         except Exception as e:
-            logger.error(f"Error in get_or_create_fabric: {e}")
+            logger.error("Error in get_or_create_fabric: %s", e)
             raise
 
     def update_fabric(self, fabric: Any, updates: Dict, verify: bool = True) -> Tuple[bool, bool]:
@@ -207,11 +252,11 @@ class NetBoxClient:
                     return node, False
             create_kwargs = {k: v for k, v in kwargs.items() if k != 'name'}
             create_data = {'aci_fabric': fabric_id, 'node_id': node_id, 'name': name, **create_kwargs}
-            logger.debug(f"Creating node with data: {create_data}")
+            logger.debug("Creating node with data: %s", create_data)
             new_obj = self.aci_plugin.nodes.create(create_data)
             return new_obj, True
         except Exception as e:
-            logger.error(f"Error in get_or_create_node: {e}")
+            logger.error("Error in get_or_create_node: %s", e)
             raise
 
     def update_node(self, node: Any, updates: Dict, verify: bool = True) -> Tuple[bool, bool]:
@@ -382,37 +427,86 @@ class NetBoxClient:
         return self._update_if_changed(entry, updates, verify)
 
     # Contract Relation Operations
-    def create_contract_relation(self, contract_id: int, epg_id: int, role: str, tenant_id: int = None, fabric_id: int = None) -> bool:
-        """Create a contract relation (EPG as provider/consumer)."""
-        try:
-            base = self.url.rstrip('/')
-            url = f"{base}/api/plugins/aci/contract-relations/"
-            headers = {
-                "Authorization": f"Token {self.token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json"
-            }
-            import requests
-            session = requests.Session()
-            session.verify = self.verify_ssl
-            response = session.get(url, headers=headers)
+    def _contract_relations_request(self, method: str, url: str, **kwargs) -> Any:
+        """Make a raw request against the contract-relations endpoint."""
+        return getattr(self.session, method)(url, timeout=self.timeout, **kwargs)
+
+    def _fetch_contract_relations(self) -> Optional[set]:
+        """
+        Fetch all existing contract relations once and index them.
+
+        Returns a set of (aci_object_type, aci_object_id, contract_id, role)
+        tuples. The set is cached on the client and extended as relations are
+        created, so duplicate relationships never hit the wire twice. Returns
+        None, and caches nothing, if the index could not be fully loaded.
+        """
+        if self._contract_relations_cache is not None:
+            return self._contract_relations_cache
+
+        relations = set()
+        url = f"{self.url}/api/plugins/aci/contract-relations/?limit=1000"
+        while url:
+            response = self._contract_relations_request('get', url)
             if response.status_code != 200:
-                logger.warning(f"Failed to query contract relations: {response.status_code}")
-                return False
+                logger.warning("Failed to query contract relations: %s", response.status_code)
+                return None
             try:
-                existing = response.json()
+                data = _json_loads(response.content)
             except Exception:
                 logger.warning("Invalid JSON response from contract-relations endpoint")
-                return False
-            results = existing.get('results', existing if isinstance(existing, list) else [])
+                return None
+            results = data.get('results', data if isinstance(data, list) else [])
             for rel in results:
-                rel_object_id = rel.get('aci_object_id')
                 rel_contract = rel.get('aci_contract')
                 rel_contract_id = rel_contract.get('id') if isinstance(rel_contract, dict) else rel_contract
-                rel_role = rel.get('role')
-                if rel_object_id == epg_id and rel_contract_id == contract_id and rel_role == role:
-                    logger.debug(f"Contract relation already exists: epg={epg_id}, contract={contract_id}, role={role}")
-                    return False
+                relations.add((
+                    rel.get('aci_object_type', ''),
+                    rel.get('aci_object_id'),
+                    rel_contract_id,
+                    rel.get('role'),
+                ))
+            url = data.get('next') if isinstance(data, dict) else None
+
+        self._contract_relations_cache = relations
+        return relations
+
+    def _create_relation(self, post_data: Dict, label: str) -> bool:
+        """POST a contract relation unless it is already known to exist."""
+        key = (
+            post_data['aci_object_type'],
+            post_data['aci_object_id'],
+            post_data['aci_contract'],
+            post_data['role'],
+        )
+        relations = self._fetch_contract_relations()
+        if relations is None:
+            # Without the full index a POST could duplicate an existing relation
+            logger.warning("Skipping %s: existing contract relations could not be loaded", label)
+            return False
+        if key in relations:
+            logger.debug("%s already exists", label)
+            return False
+
+        url = f"{self.url}/api/plugins/aci/contract-relations/"
+        logger.info("Creating %s, tenant=%s", label, post_data.get('aci_tenant'))
+        response = self._contract_relations_request('post', url, json=post_data)
+        if response.status_code in (200, 201):
+            relations.add(key)
+            logger.info("Successfully created %s", label)
+            return True
+        elif response.status_code == 500:
+            logger.debug("%s creation failed with 500 error: %s", label, response.text[:100])
+            return False
+        else:
+            logger.warning(
+                "Failed to create %s: %s - %s",
+                label, response.status_code, response.text[:200]
+            )
+            return False
+
+    def create_contract_relation(self, contract_id: int, epg_id: int, role: str, tenant_id: int = None, fabric_id: int = None) -> bool:
+        """Create a contract relation (EPG as provider/consumer)."""
+        try:
             post_data = {
                 'aci_contract': contract_id,
                 'aci_object_type': 'netbox_aci_plugin.aciendpointgroup',
@@ -423,53 +517,16 @@ class NetBoxClient:
                 post_data['aci_tenant'] = tenant_id
             if fabric_id:
                 post_data['aci_fabric'] = fabric_id
-            logger.info(f"Creating contract relation: epg={epg_id}, contract={contract_id}, role={role}, tenant={tenant_id}")
-            response = session.post(url, headers=headers, json=post_data)
-            if response.status_code in (200, 201):
-                logger.info("Successfully created contract relation")
-                return True
-            elif response.status_code == 500:
-                logger.debug(f"Contract relation creation failed with 500 error: {response.text[:100]}")
-                return False
-            else:
-                logger.warning(f"Failed to create contract relation: {response.status_code} - {response.text[:200]}")
-                return False
+            return self._create_relation(
+                post_data, f"contract relation: epg={epg_id}, contract={contract_id}, role={role}"
+            )
         except Exception as e:
-            logger.warning(f"Error creating contract relation: {e}")
+            logger.warning("Error creating contract relation: %s", e)
             return False
 
     def create_vrf_contract_relation(self, vrf_id: int, contract_id: int, role: str, tenant_id: int = None) -> bool:
         """Create a VRF contract relation for vzAny."""
         try:
-            base = self.url.rstrip('/')
-            url = f"{base}/api/plugins/aci/contract-relations/"
-            headers = {
-                "Authorization": f"Token {self.token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json"
-            }
-            import requests
-            session = requests.Session()
-            session.verify = self.verify_ssl
-            response = session.get(url, headers=headers)
-            if response.status_code != 200:
-                logger.warning(f"Failed to query contract relations for VRF: {response.status_code}")
-                return False
-            try:
-                existing = response.json()
-            except Exception:
-                logger.warning("Invalid JSON response from contract-relations endpoint")
-                return False
-            results = existing.get('results', existing if isinstance(existing, list) else [])
-            for rel in results:
-                rel_object_id = rel.get('aci_object_id')
-                rel_contract = rel.get('aci_contract')
-                rel_contract_id = rel_contract.get('id') if isinstance(rel_contract, dict) else rel_contract
-                rel_role = rel.get('role')
-                rel_type = rel.get('aci_object_type', '')
-                if 'vrf' in rel_type.lower() and rel_object_id == vrf_id and rel_contract_id == contract_id and rel_role == role:
-                    logger.debug(f"VRF contract relation already exists: vrf={vrf_id}, contract={contract_id}, role={role}")
-                    return False
             post_data = {
                 'aci_contract': contract_id,
                 'aci_object_type': 'netbox_aci_plugin.acivrf',
@@ -478,16 +535,11 @@ class NetBoxClient:
             }
             if tenant_id:
                 post_data['aci_tenant'] = tenant_id
-            logger.info(f"Creating VRF contract relation: vrf={vrf_id}, contract={contract_id}, role={role}, tenant={tenant_id}")
-            response = session.post(url, headers=headers, json=post_data)
-            if response.status_code in (200, 201):
-                logger.info("Successfully created VRF contract relation")
-                return True
-            else:
-                logger.warning(f"Failed to create VRF contract relation: {response.status_code} - {response.text[:200]}")
-                return False
+            return self._create_relation(
+                post_data, f"VRF contract relation: vrf={vrf_id}, contract={contract_id}, role={role}"
+            )
         except Exception as e:
-            logger.warning(f"Error creating VRF contract relation: {e}")
+            logger.warning("Error creating VRF contract relation: %s", e)
             return False
 
     # DCIM Device Operations (for ACI node linking)
@@ -560,13 +612,36 @@ class NetBoxClient:
             if existing:
                 return existing[0], False
         except Exception as e:
-            logger.debug(f"Error searching for IP {ip_only}: {e}")
+            logger.debug("Error searching for IP %s: %s", ip_only, e)
         return self._get_or_create(
             self.api.ipam.ip_addresses,
             {'address': address},
             {'address': address, **kwargs}
         )
 
+    def fetch_ip_addresses_in_prefix(self, prefix: str) -> Dict[str, Any]:
+        """Fetch all IP addresses inside a prefix, keyed by address without mask."""
+        try:
+            return {
+                str(ip.address).split('/')[0]: ip
+                for ip in self.api.ipam.ip_addresses.filter(parent=prefix)
+            }
+        except Exception as e:
+            logger.warning("Pre-fetch failed for IP addresses in %s: %s", prefix, e)
+            return {}
+
+    def fetch_ip_addresses(self, addresses, chunk_size: int = 100) -> Dict[str, Any]:
+        """Fetch IP addresses by host address, keyed by address without mask."""
+        addresses = sorted(set(addresses))
+        found: Dict[str, Any] = {}
+        for i in range(0, len(addresses), chunk_size):
+            try:
+                for ip in self.api.ipam.ip_addresses.filter(address=addresses[i:i + chunk_size]):
+                    found[str(ip.address).split('/')[0]] = ip
+            except Exception as e:
+                logger.warning("Pre-fetch failed for IP addresses: %s", e)
+        return found
+
     def get_or_create_prefix(self, prefix: str, **kwargs) -> Tuple[Any, bool]:
         """Get or create a NetBox Prefix."""
         return self._get_or_create(
@@ -613,29 +688,18 @@ class NetBoxClient:
         Returns:
             Response object or None on failure
         """
-        import requests
-
         base = self.url.rstrip('/')
         url = f"{base}/api/plugins/netbox_software_tracker/{endpoint}/"
         if item_id:
             url = f"{base}/api/plugins/netbox_software_tracker/{endpoint}/{item_id}/"
 
-        headers = {
-            "Authorization": f"Token {self.token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
-        session = requests.Session()
-        session.verify = self.verify_ssl
-
         try:
-            response = getattr(session, method)(
-                url, headers=headers, params=params, json=json_data
+            response = getattr(self.session, method)(
+                url, params=params, json=json_data, timeout=self.timeout
             )
             return response
         except Exception as e:
-            logger.error(f"Software tracker API request failed: {e}")
+            logger.error("Software tracker API request failed: %s", e)
             return None
 
     def get_or_create_software_image(self, version: str,
@@ -659,14 +723,14 @@ class NetBoxClient:
 
         if response and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 results = data.get('results', data if isinstance(data, list) else [])
                 for item in results:
                     if item.get('version') == version:
                         obj = self._wrap_software_tracker_obj(item, 'software-image')
                         return obj, False
             except Exception as e:
-                logger.debug(f"Error parsing software-image search response: {e}")
+                logger.debug("Error parsing software-image search response: %s", e)
 
         # Not found - create new
         create_data = {'version': version, **kwargs}
@@ -675,7 +739,7 @@ class NetBoxClient:
         )
 
         if response and response.status_code in (200, 201):
-            obj_data = response.json()
+            obj_data = _json_loads(response.content)
             obj = self._wrap_software_tracker_obj(obj_data, 'software-image')
             return obj, True
 
@@ -692,7 +756,7 @@ class NetBoxClient:
         return self._update_if_changed(sw_image, updates, verify)
 
     def assign_golden_image(self, software_image_id: int,
-                             device_type_id: int) -> bool:
+                             device_type_id: int) -> Optional[bool]:
         """
         Assign a software-image as the golden image for a device type.
 
@@ -701,7 +765,7 @@ class NetBoxClient:
             device_type_id: ID of the DCIM device type
 
         Returns:
-            True if created, False if already exists or failed
+            True if created, False if already assigned, None if the request failed
         """
         # Check for existing assignments for this device type
         response = self._software_tracker_request(
@@ -711,7 +775,7 @@ class NetBoxClient:
 
         if response and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 results = data.get('results', data if isinstance(data, list) else [])
                 for item in results:
                     # Check if this software is already assigned
@@ -737,10 +801,10 @@ class NetBoxClient:
 
         if response:
             logger.debug(
-                f"Golden image assignment failed: "
-                f"{response.status_code} - {response.text[:200]}"
+                "Golden image assignment failed: %s - %s",
+                response.status_code, response.text[:200]
             )
-        return False
+        return None
 
     def _wrap_software_tracker_obj(self, data: Dict,
                                     endpoint: str) -> Any:
@@ -758,8 +822,12 @@ class NetBoxClient:
                 'patch', endpoint, json_data=updates, item_id=obj_id
             )
             if response and response.status_code in (200, 201):
-                # Update local attributes
-                for k, v in updates.items():
+                # Refresh local attributes from the PATCH response
+                try:
+                    data = _json_loads(response.content)
+                except ValueError:
+                    data = updates
+                for k, v in data.items():
                     setattr(obj, k, v)
                 return True
             return False
@@ -767,16 +835,132 @@ class NetBoxClient:
         obj.update = _update
         return obj
 
+    # Pre-fetch Operations
+    #
+    # Sync modules treat a pre-fetched cache as authoritative (a miss means
+    # the object is new), so failures propagate instead of returning an
+    # empty cache that would queue a create for every existing object.
+    def _fetch_all(self, endpoint, key_field: str, **filters) -> Dict[Any, Any]:
+        """Fetch all objects matching filters in one paged query, keyed by key_field."""
+        return {getattr(obj, key_field): obj for obj in endpoint.filter(**filters)}
+
+    def fetch_all_pods(self, fabric_id: int) -> Dict[int, Any]:
+        return self._fetch_all(self.aci_plugin.pods, 'pod_id', aci_fabric_id=fabric_id)
+
+    def fetch_all_nodes(self, fabric_id: int) -> Dict[int, Any]:
+        return self._fetch_all(self.aci_plugin.nodes, 'node_id', aci_fabric_id=fabric_id)
+
+    def fetch_all_tenants(self, fabric_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.tenants, 'name', aci_fabric_id=fabric_id)
+
+    def fetch_all_vrfs(self, tenant_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.vrfs, 'name', aci_tenant_id=tenant_id)
+
+    def fetch_all_bridge_domains(self, tenant_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.bridge_domains, 'name', aci_tenant_id=tenant_id)
+
+    def fetch_all_app_profiles(self, tenant_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.app_profiles, 'name', aci_tenant_id=tenant_id)
+
+    def fetch_all_epgs(self, ap_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.endpoint_groups, 'name', aci_app_profile_id=ap_id)
+
+    def fetch_all_esgs_flat(self, tenant_ids: List[int]) -> Dict[Tuple[int, str], Any]:
+        """Fetch the ESGs of the given tenants in one paged query, keyed by (ap_id, name)."""
+        if not tenant_ids:
+            return {}
+        return {
+            (getattr(esg.aci_app_profile, 'id', None), esg.name): esg
+            for esg in self.aci_plugin.endpoint_security_groups.filter(aci_tenant_id=tenant_ids)
+        }
+
+    def fetch_all_contracts(self, tenant_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.contracts, 'name', aci_tenant_id=tenant_id)
+
+    def fetch_all_contract_filters(self, tenant_id: int) -> Dict[str, Any]:
+        return self._fetch_all(self.aci_plugin.contract_filters, 'name', aci_tenant_id=tenant_id)
+
+    def fetch_all_device_types(self, manufacturer_id: int) -> List[Any]:
+        return list(self.api.dcim.device_types.filter(manufacturer_id=manufacturer_id))
+
+    def _fetch_by_values(self, endpoint, key_field: str, values,
+                         chunk_size: int = 100) -> Dict[Any, Any]:
+        """
+        Fetch the objects whose key_field is one of values, keyed by key_field.
+
+        Values are sent as a repeated filter in chunks to stay under URL
+        length limits.
+        """
+        values = sorted(set(values))
+        found: Dict[Any, Any] = {}
+        for i in range(0, len(values), chunk_size):
+            found.update(self._fetch_all(endpoint, key_field,
+                                         **{key_field: values[i:i + chunk_size]}))
+        return found
+
+    def fetch_dcim_devices_by_name(self, names) -> Dict[str, Any]:
+        return self._fetch_by_values(self.api.dcim.devices, 'name', names)
+
+    def fetch_device_types_by_model(self, models) -> Dict[str, Any]:
+        return self._fetch_by_values(self.api.dcim.device_types, 'model', models)
+
+    # Cached Lookups (check a pre-fetched cache before hitting the API)
+    def _get_or_create_cached(self, cache: Dict, key: Any, get_or_create: Callable,
+                              *args, **kwargs) -> Tuple[Any, bool]:
+        if key in cache:
+            return cache[key], False
+        obj, created = get_or_create(*args, **kwargs)
+        cache[key] = obj
+        return obj, created
+
+    def get_or_create_bd_cached(self, cache: Dict, name: str, tenant_id: int,
+                                vrf_id: int, **kwargs) -> Tuple[Any, bool]:
+        return self._get_or_create_cached(cache, name, self.get_or_create_bridge_domain,
+                                          tenant_id, vrf_id, name, **kwargs)
+
+    def get_or_create_ap_cached(self, cache: Dict, name: str, tenant_id: int,
+                                **kwargs) -> Tuple[Any, bool]:
+        return self._get_or_create_cached(cache, name, self.get_or_create_app_profile,
+                                          tenant_id, name, **kwargs)
+
+    def get_or_create_epg_cached(self, cache: Dict, name: str, ap_id: int,
+                                 bd_id: int, **kwargs) -> Tuple[Any, bool]:
+        return self._get_or_create_cached(cache, name, self.get_or_create_epg,
+                                          ap_id, bd_id, name, **kwargs)
+
+    def get_or_create_contract_cached(self, cache: Dict, name: str, tenant_id: int,
+                                      **kwargs) -> Tuple[Any, bool]:
+        return self._get_or_create_cached(cache, name, self.get_or_create_contract,
+                                          tenant_id, name, **kwargs)
+
+    def get_or_create_filter_cached(self, cache: Dict, name: str, tenant_id: int,
+                                    **kwargs) -> Tuple[Any, bool]:
+        return self._get_or_create_cached(cache, name, self.get_or_create_contract_filter,
+                                          tenant_id, name, **kwargs)
+
     # Bulk Operations
     def bulk_create(self, endpoint, objects: List[Dict]) -> List[Any]:
-        """Create multiple objects at once."""
+        """Create multiple objects with a single POST."""
         try:
             return endpoint.create(objects)
         except Exception as e:
-            logger.error(f"Bulk create failed: {e}")
+            logger.error("Bulk create failed: %s", e)
+            return []
+
+    def bulk_update(self, endpoint, objects: List[Dict]) -> List[Any]:
+        """
+        Update multiple objects with a single PATCH.
+
+        Each dict must carry the object's 'id' plus the fields to change.
+        Returns the updated records, or an empty list on failure.
+        """
+        try:
+            return endpoint.update(objects)
+        except Exception as e:
+            logger.error("Bulk update failed: %s", e)
             return []
 
     # Cache Management
     def clear_cache(self) -> None:
         """Clear any cached data."""
-        pass
\ No newline at end of file
+        self._contract_relations_cache = None
\ No newline at end of file
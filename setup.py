@@ -15,7 +15,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.9",
     install_requires=[
-        "pynetbox>=7.0.0",
+        "pynetbox>=7.7.0",
         "pyyaml>=6.0",
         "requests>=2.28.0",
     ],